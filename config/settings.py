@@ -51,7 +51,8 @@ class Settings:
                 'hardware_acceleration': 'True',
                 'buffer_size': '1024',
                 'fps_limit': '60',
-                'quality_auto_adjust': 'True'
+                'quality_auto_adjust': 'True',
+                'parallel_scan': 'False'
             },
             'keyboard': {
                 'space_play_pause': 'True',
@@ -131,6 +132,16 @@ class Settings:
         except Exception as e:
             self.logger.error(f"Error setting configuration value: {e}")
     
+    def update(self, section, values):
+        """Set several configuration values in one section"""
+        try:
+            if not self.config.has_section(section):
+                self.config.add_section(section)
+            for option, value in values.items():
+                self.config.set(section, option, str(value))
+        except Exception as e:
+            self.logger.error(f"Error setting configuration values: {e}")
+    
     def get_recent_files(self):
         """Get list of recent files"""
         try:
@@ -4,7 +4,7 @@ Dialog windows for the video player application
 
 import tkinter as tk
 from tkinter import ttk, messagebox, colorchooser
-from ui.styles import COLORS
+from ui.styles import PALETTE
 from utils.logger import Logger
 
 class AboutDialog:
@@ -22,16 +22,31 @@ class AboutDialog:
         self.dialog.resizable(False, False)
         
         # Configure dialog
-        self.dialog.configure(bg=COLORS['bg_primary'])
+        self.dialog.configure(bg=PALETTE.bg_primary)
         self.dialog.transient(parent)
         self.dialog.grab_set()
         
+        # Hide instead of destroying so the dialog can be reused
+        self.dialog.protocol("WM_DELETE_WINDOW", self.hide)
+        
         # Center dialog
         self._center_dialog()
         
         # Create content
         self._create_content()
     
+    def show(self):
+        """Show a previously hidden dialog"""
+        self.dialog.deiconify()
+        self._center_dialog()
+        self.dialog.lift()
+        self.dialog.grab_set()
+    
+    def hide(self):
+        """Hide the dialog, keeping its widgets for reuse"""
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+    
     def _center_dialog(self):
         """Center dialog relative to parent"""
         self.dialog.update_idletasks()
@@ -53,15 +68,15 @@ class AboutDialog:
     
     def _create_content(self):
         """Create dialog content"""
-        main_frame = tk.Frame(self.dialog, bg=COLORS['bg_primary'])
+        main_frame = tk.Frame(self.dialog, bg=PALETTE.bg_primary)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # Application icon/logo (text-based)
         icon_label = tk.Label(
             main_frame,
             text="🎬",
-            bg=COLORS['bg_primary'],
-            fg=COLORS['accent'],
+            bg=PALETTE.bg_primary,
+            fg=PALETTE.accent,
             font=('Segoe UI', 48)
         )
         icon_label.pack(pady=10)
@@ -70,8 +85,8 @@ class AboutDialog:
         name_label = tk.Label(
             main_frame,
             text="Beautiful Video Player",
-            bg=COLORS['bg_primary'],
-            fg=COLORS['fg_primary'],
+            bg=PALETTE.bg_primary,
+            fg=PALETTE.fg_primary,
             font=('Segoe UI', 16, 'bold')
         )
         name_label.pack()
@@ -80,8 +95,8 @@ class AboutDialog:
         version_label = tk.Label(
             main_frame,
             text="Version 1.0.0",
-            bg=COLORS['bg_primary'],
-            fg=COLORS['fg_secondary'],
+            bg=PALETTE.bg_primary,
+            fg=PALETTE.fg_secondary,
             font=('Segoe UI', 10)
         )
         version_label.pack(pady=5)
@@ -90,8 +105,8 @@ class AboutDialog:
         desc_label = tk.Label(
             main_frame,
             text="A modern, responsive video player built with Python and Tkinter.\nFeatures beautiful interface, smooth playback, and modular architecture.",
-            bg=COLORS['bg_primary'],
-            fg=COLORS['fg_primary'],
+            bg=PALETTE.bg_primary,
+            fg=PALETTE.fg_primary,
             font=('Segoe UI', 9),
             justify='center',
             wraplength=350
@@ -102,8 +117,8 @@ class AboutDialog:
         copyright_label = tk.Label(
             main_frame,
             text="© 2024 Beautiful Video Player\nBuilt with Python, Tkinter, and OpenCV",
-            bg=COLORS['bg_primary'],
-            fg=COLORS['fg_secondary'],
+            bg=PALETTE.bg_primary,
+            fg=PALETTE.fg_secondary,
             font=('Segoe UI', 8),
             justify='center'
         )
@@ -113,17 +128,19 @@ class AboutDialog:
         close_btn = ttk.Button(
             main_frame,
             text="Close",
-            command=self.dialog.destroy
+            command=self.hide
         )
         close_btn.pack(pady=10)
 
 class SettingsDialog:
     """Settings configuration dialog"""
     
-    def __init__(self, parent, settings):
+    def __init__(self, parent, settings, on_apply=None, save_settings=None):
         """Initialize settings dialog"""
         self.parent = parent
         self.settings = settings
+        self.on_apply = on_apply
+        self.save_settings = save_settings or settings.save
         self.logger = Logger.get_logger()
         
         # Create dialog window
@@ -133,10 +150,13 @@ class SettingsDialog:
         self.dialog.resizable(False, False)
         
         # Configure dialog
-        self.dialog.configure(bg=COLORS['bg_primary'])
+        self.dialog.configure(bg=PALETTE.bg_primary)
         self.dialog.transient(parent)
         self.dialog.grab_set()
         
+        # Hide instead of destroying so the dialog can be reused
+        self.dialog.protocol("WM_DELETE_WINDOW", self.hide)
+        
         # Center dialog
         self._center_dialog()
         
@@ -146,6 +166,19 @@ class SettingsDialog:
         # Load current settings
         self._load_settings()
     
+    def show(self):
+        """Show a previously hidden dialog with current settings"""
+        self._load_settings()
+        self.dialog.deiconify()
+        self._center_dialog()
+        self.dialog.lift()
+        self.dialog.grab_set()
+    
+    def hide(self):
+        """Hide the dialog, keeping its widgets for reuse"""
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+    
     def _center_dialog(self):
         """Center dialog relative to parent"""
         self.dialog.update_idletasks()
@@ -166,7 +199,7 @@ class SettingsDialog:
     def _create_content(self):
         """Create settings dialog content"""
         # Main frame with scrollbar
-        main_frame = tk.Frame(self.dialog, bg=COLORS['bg_primary'])
+        main_frame = tk.Frame(self.dialog, bg=PALETTE.bg_primary)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # Create notebook for tabs
@@ -181,12 +214,12 @@ class SettingsDialog:
         self._create_keyboard_tab()
         
         # Button frame
-        button_frame = tk.Frame(main_frame, bg=COLORS['bg_primary'])
+        button_frame = tk.Frame(main_frame, bg=PALETTE.bg_primary)
         button_frame.pack(fill=tk.X)
         
         # Buttons
         ttk.Button(button_frame, text="Reset to Defaults", command=self._reset_defaults).pack(side=tk.LEFT)
-        ttk.Button(button_frame, text="Cancel", command=self.dialog.destroy).pack(side=tk.RIGHT, padx=(5, 0))
+        ttk.Button(button_frame, text="Cancel", command=self.hide).pack(side=tk.RIGHT, padx=(5, 0))
         ttk.Button(button_frame, text="Apply", command=self._apply_settings).pack(side=tk.RIGHT, padx=(5, 0))
         ttk.Button(button_frame, text="OK", command=self._ok_clicked).pack(side=tk.RIGHT, padx=(5, 0))
     
@@ -445,7 +478,11 @@ class SettingsDialog:
             self.settings.set('keyboard', 'volume_keys', str(self.volume_keys_var.get()))
             
             # Save settings
-            self.settings.save()
+            self.save_settings()
+            
+            # Notify owner so it can refresh cached values
+            if self.on_apply:
+                self.on_apply()
             
             messagebox.showinfo("Settings", "Settings applied successfully!")
             
@@ -458,12 +495,14 @@ class SettingsDialog:
         if messagebox.askyesno("Reset Settings", "Are you sure you want to reset all settings to defaults?"):
             self.settings.reset_to_defaults()
             self._load_settings()
+            if self.on_apply:
+                self.on_apply()
             messagebox.showinfo("Settings", "Settings reset to defaults!")
     
     def _ok_clicked(self):
         """Handle OK button click"""
         self._apply_settings()
-        self.dialog.destroy()
+        self.hide()
 
 class PlaylistDialog:
     """Playlist management dialog"""
@@ -480,7 +519,7 @@ class PlaylistDialog:
         self.dialog.geometry("600x400")
         
         # Configure dialog
-        self.dialog.configure(bg=COLORS['bg_primary'])
+        self.dialog.configure(bg=PALETTE.bg_primary)
         self.dialog.transient(parent)
         
         # Create content
@@ -491,19 +530,19 @@ class PlaylistDialog:
     
     def _create_content(self):
         """Create playlist dialog content"""
-        main_frame = tk.Frame(self.dialog, bg=COLORS['bg_primary'])
+        main_frame = tk.Frame(self.dialog, bg=PALETTE.bg_primary)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # Playlist listbox with scrollbar
-        list_frame = tk.Frame(main_frame, bg=COLORS['bg_primary'])
+        list_frame = tk.Frame(main_frame, bg=PALETTE.bg_primary)
         list_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         
         self.playlist_listbox = tk.Listbox(
             list_frame,
-            bg=COLORS['bg_secondary'],
-            fg=COLORS['fg_primary'],
-            selectbackground=COLORS['accent'],
-            selectforeground=COLORS['fg_primary'],
+            bg=PALETTE.bg_secondary,
+            fg=PALETTE.fg_primary,
+            selectbackground=PALETTE.accent,
+            selectforeground=PALETTE.fg_primary,
             font=('Segoe UI', 9)
         )
         self.playlist_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -513,7 +552,7 @@ class PlaylistDialog:
         self.playlist_listbox.config(yscrollcommand=scrollbar.set)
         
         # Button frame
-        button_frame = tk.Frame(main_frame, bg=COLORS['bg_primary'])
+        button_frame = tk.Frame(main_frame, bg=PALETTE.bg_primary)
         button_frame.pack(fill=tk.X)
         
         # Buttons
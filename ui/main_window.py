@@ -5,6 +5,11 @@ Main window for the video player application
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import threading
+import time
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
 
 from ui.controls import PlayerControls
@@ -16,9 +21,83 @@ from utils.keyboard_handler import KeyboardHandler
 from utils.logger import Logger
 from utils.file_manager import FileManager
 
+# File dialog filters for opening videos
+_VIDEO_FILETYPES = (
+    ("Video files", "*.mp4 *.avi *.mov *.mkv *.wmv *.flv *.webm *.m4v"),
+    ("MP4 files", "*.mp4"),
+    ("AVI files", "*.avi"),
+    ("MOV files", "*.mov"),
+    ("All files", "*.*")
+)
+
+# Rows shown in the keyboard shortcuts dialog
+_SHORTCUTS = (
+    ("Space", "Play/Pause"),
+    ("F", "Toggle Fullscreen"),
+    ("C", "Show/Hide Controls"),
+    ("S", "Stop"),
+    ("M", "Mute/Unmute"),
+    ("↑/↓", "Volume Up/Down"),
+    ("←/→", "Seek Backward/Forward"),
+    ("N", "Next Video"),
+    ("P", "Previous Video"),
+    ("Ctrl+O", "Open File"),
+    ("Ctrl+Q", "Quit")
+)
+
 class MainWindow:
     """Main application window"""
     
+    # Interval (ms) for polling background I/O results
+    IO_POLL_INTERVAL = 50
+    
+    # Menu bar layout: (menu label, items); command items name the
+    # MainWindow attribute to call, cascades the attribute to store the submenu in
+    _MENU_SPEC = (
+        ('File', (
+            ('command', "Open File...", 'open_file', "Ctrl+O"),
+            ('command', "Open Folder...", 'open_folder', "Ctrl+Shift+O"),
+            ('separator',),
+            ('cascade', "Recent Files", 'recent_menu'),
+            ('separator',),
+            ('command', "Exit", 'root.quit', "Ctrl+Q"),
+        )),
+        ('View', (
+            ('command', "Fullscreen", 'toggle_fullscreen', "F"),
+            ('command', "Always on Top", 'toggle_always_on_top', None),
+            ('separator',),
+            ('command', "Show/Hide Controls", 'toggle_controls', "C"),
+        )),
+        ('Playback', (
+            ('command', "Play/Pause", 'toggle_playback', "Space"),
+            ('command', "Stop", 'stop_playback', "S"),
+            ('separator',),
+            ('command', "Previous", 'previous_video', "P"),
+            ('command', "Next", 'next_video', "N"),
+        )),
+        ('Help', (
+            ('command', "Keyboard Shortcuts", 'show_shortcuts', None),
+            ('command', "Settings", 'show_settings', None),
+            ('separator',),
+            ('command', "About", 'show_about', None),
+        )),
+    )
+    
+    # Keyboard actions and the MainWindow methods that handle them
+    _KEY_ACTIONS = (
+        ('play_pause', 'toggle_playback'),
+        ('stop', 'stop_playback'),
+        ('fullscreen', 'toggle_fullscreen'),
+        ('volume_up', 'volume_up'),
+        ('volume_down', 'volume_down'),
+        ('mute', 'toggle_mute'),
+        ('seek_forward', 'seek_forward'),
+        ('seek_backward', 'seek_backward'),
+        ('next', 'next_video'),
+        ('previous', 'previous_video'),
+        ('open_file', 'open_file'),
+    )
+    
     def __init__(self, root, settings):
         """Initialize the main window"""
         self.root = root
@@ -36,6 +115,28 @@ class MainWindow:
         self.normal_geometry = None
         self.controls_visible = True
         self.auto_hide_timer = None
+        self._last_motion_ts = 0.0
+        self._settings_save_timer = None
+        self._geom_pending = False
+        self._canvas_w = -1
+        self._canvas_h = -1
+        
+        # Background file I/O, results are polled back onto the Tk thread
+        self._io_executor = ThreadPoolExecutor(max_workers=1)
+        self._io_queue = queue.Queue()
+        self._io_pending = 0
+        self._io_pump_timer = None
+        
+        # Recent files shown in the menu, indexed by menu entry
+        self._recent_files = []
+        self._recent_files_hash = None
+        
+        # Dialogs are built on first use and reused afterwards
+        self._dialog_cache = {}
+        self._shortcuts_dialog = None
+        
+        # Cached settings read on hot event paths
+        self.reload_settings()
         
         # Setup UI
         self._create_menu()
@@ -54,45 +155,30 @@ class MainWindow:
         self.menubar = tk.Menu(self.root)
         self.root.config(menu=self.menubar)
         
-        # File menu
-        file_menu = tk.Menu(self.menubar, tearoff=0)
-        self.menubar.add_cascade(label="File", menu=file_menu)
-        file_menu.add_command(label="Open File...", command=self.open_file, accelerator="Ctrl+O")
-        file_menu.add_command(label="Open Folder...", command=self.open_folder, accelerator="Ctrl+Shift+O")
-        file_menu.add_separator()
+        for label, items in self._MENU_SPEC:
+            menu = tk.Menu(self.menubar, tearoff=0)
+            self.menubar.add_cascade(label=label, menu=menu)
+            self._build_menu(menu, items)
         
-        # Recent files submenu
-        self.recent_menu = tk.Menu(file_menu, tearoff=0)
-        file_menu.add_cascade(label="Recent Files", menu=self.recent_menu)
         self._update_recent_files_menu()
-        
-        file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit, accelerator="Ctrl+Q")
-        
-        # View menu
-        view_menu = tk.Menu(self.menubar, tearoff=0)
-        self.menubar.add_cascade(label="View", menu=view_menu)
-        view_menu.add_command(label="Fullscreen", command=self.toggle_fullscreen, accelerator="F")
-        view_menu.add_command(label="Always on Top", command=self.toggle_always_on_top)
-        view_menu.add_separator()
-        view_menu.add_command(label="Show/Hide Controls", command=self.toggle_controls, accelerator="C")
-        
-        # Playback menu
-        playback_menu = tk.Menu(self.menubar, tearoff=0)
-        self.menubar.add_cascade(label="Playback", menu=playback_menu)
-        playback_menu.add_command(label="Play/Pause", command=self.toggle_playback, accelerator="Space")
-        playback_menu.add_command(label="Stop", command=self.stop_playback, accelerator="S")
-        playback_menu.add_separator()
-        playback_menu.add_command(label="Previous", command=self.previous_video, accelerator="P")
-        playback_menu.add_command(label="Next", command=self.next_video, accelerator="N")
-        
-        # Help menu
-        help_menu = tk.Menu(self.menubar, tearoff=0)
-        self.menubar.add_cascade(label="Help", menu=help_menu)
-        help_menu.add_command(label="Keyboard Shortcuts", command=self.show_shortcuts)
-        help_menu.add_command(label="Settings", command=self.show_settings)
-        help_menu.add_separator()
-        help_menu.add_command(label="About", command=self.show_about)
+    
+    def _build_menu(self, menu, items):
+        """Populate a menu from a _MENU_SPEC item list"""
+        for kind, *args in items:
+            if kind == 'command':
+                label, command, accelerator = args
+                menu.add_command(
+                    label=label,
+                    command=attrgetter(command)(self),
+                    accelerator=accelerator
+                )
+            elif kind == 'separator':
+                menu.add_separator()
+            elif kind == 'cascade':
+                label, attr = args
+                submenu = tk.Menu(menu, tearoff=0)
+                setattr(self, attr, submenu)
+                menu.add_cascade(label=label, menu=submenu)
     
     def _create_main_frame(self):
         """Create the main container frame"""
@@ -116,14 +202,16 @@ class MainWindow:
         )
         self.video_canvas.pack(fill=tk.BOTH, expand=True)
         
-        # Placeholder text
-        self.placeholder_text = self.video_canvas.create_text(
-            0, 0,
+        # Placeholder text, centered over the canvas by the placer
+        self.placeholder_label = tk.Label(
+            self.video_frame,
             text="Drop a video file here or use File > Open File",
-            fill='white',
-            font=('Arial', 16),
-            anchor='center'
+            bg='black',
+            fg='white',
+            font=('Arial', 16)
         )
+        self.placeholder_label.place(relx=0.5, rely=0.5, anchor='center')
+        self.placeholder_label.bind('<Double-Button-1>', self.toggle_fullscreen)
         
         # Initialize video player
         self.video_player = VideoPlayer(self.video_canvas, self.settings)
@@ -152,21 +240,10 @@ class MainWindow:
     
     def _setup_bindings(self):
         """Setup keyboard and window bindings"""
-        # Keyboard bindings
-        self.keyboard_handler.setup_bindings(self.root, {
-            'play_pause': self.toggle_playback,
-            'stop': self.stop_playback,
-            'fullscreen': self.toggle_fullscreen,
-            'volume_up': self.volume_up,
-            'volume_down': self.volume_down,
-            'mute': self.toggle_mute,
-            'seek_forward': self.seek_forward,
-            'seek_backward': self.seek_backward,
-            'next': self.next_video,
-            'previous': self.previous_video,
-            'open_file': self.open_file,
-            'quit': self.root.quit
-        })
+        # Keyboard bindings, resolved to bound methods once
+        callbacks = {action: getattr(self, method) for action, method in self._KEY_ACTIONS}
+        callbacks['quit'] = self.root.quit
+        self.keyboard_handler.setup_bindings(self.root, callbacks)
         
         # Window events
         self.root.bind('<Configure>', self._on_window_configure)
@@ -180,21 +257,22 @@ class MainWindow:
         """Setup drag and drop functionality"""
         try:
             # Enable drag and drop
-            self.video_canvas.drop_target_register('DND_Files')
-            self.video_canvas.dnd_bind('<<Drop>>', self._on_file_drop)
+            for widget in (self.video_canvas, self.placeholder_label):
+                widget.drop_target_register('DND_Files')
+                widget.dnd_bind('<<Drop>>', self._on_file_drop)
         except Exception as e:
             self.logger.debug(f"Drag and drop not available: {e}")
     
     def _on_canvas_configure(self, event):
         """Handle canvas resize"""
-        # Update placeholder text position
         canvas_width = event.width
         canvas_height = event.height
-        self.video_canvas.coords(
-            self.placeholder_text,
-            canvas_width // 2,
-            canvas_height // 2
-        )
+        
+        # Tk also emits Configure for re-layouts that keep the same size
+        if canvas_width == self._canvas_w and canvas_height == self._canvas_h:
+            return
+        self._canvas_w = canvas_width
+        self._canvas_h = canvas_height
         
         # Update video player
         if self.video_player:
@@ -208,16 +286,28 @@ class MainWindow:
     
     def _on_window_configure(self, event):
         """Handle window resize"""
-        if event.widget == self.root:
-            if not self.is_fullscreen:
-                # Save normal geometry
-                self.normal_geometry = self.root.geometry()
+        if event.widget is self.root and not self.is_fullscreen:
+            # Coalesce a resize drag into a single geometry read
+            if not self._geom_pending:
+                self._geom_pending = True
+                self.root.after_idle(self._flush_geometry)
+    
+    def _flush_geometry(self):
+        """Save normal geometry once pending Configure events are handled"""
+        self._geom_pending = False
+        if not self.is_fullscreen:
+            self.normal_geometry = self.root.geometry()
     
     def _on_mouse_motion(self, event):
         """Handle mouse movement for auto-hiding controls"""
-        if self.settings.getboolean('controls', 'auto_hide_controls'):
+        if self._cfg_auto_hide:
             self.show_controls()
-            self._schedule_hide_controls()
+            self._last_motion_ts = time.monotonic()
+            
+            # A single pending check is re-armed from _auto_hide_check,
+            # so motion events only need to record their timestamp
+            if not self.auto_hide_timer:
+                self._schedule_hide_controls()
     
     def _on_focus_in(self, event):
         """Handle window focus in"""
@@ -232,64 +322,126 @@ class MainWindow:
     def _on_file_drop(self, event):
         """Handle file drop"""
         try:
-            files = event.data.split()
+            # Tk's own list parser keeps brace-quoted paths with spaces intact
+            files = self.video_canvas.tk.splitlist(event.data)
             if files:
                 self.load_video(files[0])
         except Exception as e:
             self.logger.error(f"Error handling file drop: {e}")
     
-    def _update_recent_files_menu(self):
+    def _update_recent_files_menu(self, rebuild=False):
         """Update the recent files menu"""
+        recent_files = self.settings.get_recent_files()
+        
+        # Nothing to do if the list is unchanged since the last update
+        files_hash = hash(tuple(recent_files))
+        if files_hash == self._recent_files_hash and not rebuild:
+            return
+        self._recent_files_hash = files_hash
+        
+        old_files = self._recent_files
+        self._recent_files = recent_files
+        
+        if not rebuild and self._patch_recent_files_menu(old_files, recent_files):
+            return
+        
         self.recent_menu.delete(0, 'end')
         
-        recent_files = self.settings.get_recent_files()
         if not recent_files:
             self.recent_menu.add_command(label="(No recent files)", state='disabled')
             return
         
         for file_path in recent_files:
-            filename = Path(file_path).name
             self.recent_menu.add_command(
-                label=filename,
-                command=lambda f=file_path: self.load_video(f)
+                label=Path(file_path).name,
+                command=partial(self.load_video, file_path)
             )
         
         self.recent_menu.add_separator()
         self.recent_menu.add_command(label="Clear Recent Files", command=self._clear_recent_files)
     
+    def _patch_recent_files_menu(self, old_files, new_files):
+        """Patch the menu in place when a file moved to the top of the list
+        
+        Returns False when the change needs a full rebuild instead.
+        """
+        if not old_files or not new_files:
+            return False
+        
+        top = new_files[0]
+        remaining = [f for f in old_files if f != top]
+        if new_files[1:] != remaining[:len(new_files) - 1]:
+            return False
+        
+        if top in old_files:
+            self.recent_menu.delete(old_files.index(top))
+        self.recent_menu.insert_command(
+            0,
+            label=Path(top).name,
+            command=partial(self.load_video, top)
+        )
+        
+        # Drop entries pushed past the end of the list
+        excess = len(remaining) + 1 - len(new_files)
+        if excess > 0:
+            self.recent_menu.delete(len(new_files), len(new_files) + excess - 1)
+        
+        return True
+    
     def _clear_recent_files(self):
         """Clear recent files list"""
         if messagebox.askyesno("Clear Recent Files", "Are you sure you want to clear the recent files list?"):
             # Clear from config
             if self.settings.config.has_section('recent_files'):
                 self.settings.config.remove_section('recent_files')
-                self.settings.save()
-            self._update_recent_files_menu()
+                self._schedule_settings_save()
+            self._update_recent_files_menu(rebuild=True)
+    
+    def _schedule_settings_save(self, delay_ms=500):
+        """Save settings after a short delay, coalescing repeated requests"""
+        if self._settings_save_timer:
+            self.root.after_cancel(self._settings_save_timer)
+        self._settings_save_timer = self.root.after(delay_ms, self._flush_settings_save)
     
-    def _schedule_hide_controls(self):
+    def _flush_settings_save(self):
+        """Write settings scheduled by _schedule_settings_save"""
+        self._settings_save_timer = None
+        self.settings.save()
+    
+    def _schedule_hide_controls(self, delay=None):
         """Schedule hiding controls after delay"""
         if self.auto_hide_timer:
             self.root.after_cancel(self.auto_hide_timer)
         
-        delay = self.settings.getint('controls', 'hide_delay', 3000)
-        self.auto_hide_timer = self.root.after(delay, self.hide_controls)
+        if delay is None:
+            delay = self._cfg_hide_delay
+        self.auto_hide_timer = self.root.after(delay, self._auto_hide_check)
+    
+    def _auto_hide_check(self):
+        """Hide controls once the mouse has been idle for the hide delay"""
+        self.auto_hide_timer = None
+        
+        elapsed_ms = int((time.monotonic() - self._last_motion_ts) * 1000)
+        if elapsed_ms >= self._cfg_hide_delay:
+            self.hide_controls()
+        else:
+            self._schedule_hide_controls(self._cfg_hide_delay - elapsed_ms)
+    
     
     # Public methods for video control
+    def reload_settings(self):
+        """Refresh settings cached for hot event paths"""
+        self._cfg_auto_hide = self.settings.getboolean('controls', 'auto_hide_controls')
+        self._cfg_hide_delay = self.settings.getint('controls', 'hide_delay', 3000)
+        self._cfg_auto_play = self.settings.getboolean('player', 'auto_play')
+    
     def open_file(self):
         """Open file dialog to select video"""
-        file_types = [
-            ("Video files", "*.mp4 *.avi *.mov *.mkv *.wmv *.flv *.webm *.m4v"),
-            ("MP4 files", "*.mp4"),
-            ("AVI files", "*.avi"),
-            ("MOV files", "*.mov"),
-            ("All files", "*.*")
-        ]
-        
         initial_dir = self.settings.get('files', 'last_directory', '')
         
         filename = filedialog.askopenfilename(
             title="Select Video File",
-            filetypes=file_types,
+            filetypes=_VIDEO_FILETYPES,
             initialdir=initial_dir
         )
         
@@ -310,13 +462,18 @@ class MainWindow:
     
     def load_video(self, file_path):
         """Load and play video file"""
+        # Check the file on the I/O worker so slow drives don't block the UI
+        self._submit_io(partial(self._on_video_checked, file_path), Path(file_path).exists)
+    
+    def _on_video_checked(self, file_path, future):
+        """Finish loading a video once its existence check completes"""
         try:
-            if not Path(file_path).exists():
+            if not future.result():
                 messagebox.showerror("Error", f"File not found: {file_path}")
                 return
             
             # Hide placeholder text
-            self.video_canvas.itemconfig(self.placeholder_text, state='hidden')
+            self.placeholder_label.place_forget()
             
             # Load video
             if self.video_player.load_video(file_path):
@@ -332,7 +489,7 @@ class MainWindow:
                 self.settings.set('files', 'last_directory', str(Path(file_path).parent))
                 
                 # Auto-play if enabled
-                if self.settings.getboolean('player', 'auto_play'):
+                if self._cfg_auto_play:
                     self.video_player.play()
                 
                 self.logger.info(f"Video loaded: {file_path}")
@@ -345,15 +502,25 @@ class MainWindow:
     
     def load_folder(self, folder_path):
         """Load all videos from folder into playlist"""
+        self._submit_io(
+            partial(self._on_folder_scanned, folder_path),
+            self.file_manager.get_video_files,
+            folder_path
+        )
+    
+    def _on_folder_scanned(self, folder_path, future):
+        """Finish loading a folder once its video files are enumerated"""
         try:
-            video_files = self.file_manager.get_video_files(folder_path)
+            video_files = future.result()
             
             if not video_files:
                 messagebox.showwarning("Warning", "No video files found in the selected folder")
                 return
             
-            # Load into playlist
-            self.playlist_manager.load_folder(folder_path)
+            # Load into playlist from the worker's listing; load_folder
+            # would rescan the whole directory on the UI thread
+            self.playlist_manager.clear()
+            self.playlist_manager.add_files(video_files)
             
             # Load first video
             if video_files:
@@ -365,6 +532,36 @@ class MainWindow:
             self.logger.error(f"Error loading folder: {e}")
             messagebox.showerror("Error", f"Error loading folder: {e}")
     
+    def _submit_io(self, callback, func, *args):
+        """Run func on the I/O worker and pass its future to callback on the UI thread"""
+        future = self._io_executor.submit(func, *args)
+        future.add_done_callback(lambda f: self._io_queue.put((callback, f)))
+        self._io_pending += 1
+        
+        if self._io_pump_timer is None:
+            self._io_pump_timer = self.root.after(self.IO_POLL_INTERVAL, self._pump_io)
+    
+    def _pump_io(self):
+        """Deliver completed I/O results to their callbacks"""
+        self._io_pump_timer = None
+        
+        while True:
+            try:
+                callback, future = self._io_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._io_pending -= 1
+            
+            # A failing callback must not strand the results queued behind it
+            try:
+                callback(future)
+            except Exception as e:
+                self.logger.error(f"Error in I/O completion callback: {e}", exc_info=True)
+        
+        # Keep polling only while work is outstanding
+        if self._io_pending:
+            self._io_pump_timer = self.root.after(self.IO_POLL_INTERVAL, self._pump_io)
+    
     def toggle_playback(self):
         """Toggle play/pause"""
         if self.video_player and self.video_player.is_loaded():
@@ -390,24 +587,30 @@ class MainWindow:
         if prev_file:
             self.load_video(prev_file)
     
-    def toggle_fullscreen(self):
+    def toggle_fullscreen(self, event=None):
         """Toggle fullscreen mode"""
+        # normal_geometry is kept current by _on_window_configure; only
+        # a resize still waiting for its idle flush needs reading here
+        if self._geom_pending:
+            self._flush_geometry()
+        
         self.is_fullscreen = not self.is_fullscreen
         
         if self.is_fullscreen:
-            self.normal_geometry = self.root.geometry()
-            self.root.attributes('-fullscreen', True)
+            self.root.tk.call('wm', 'attributes', self.root._w, '-fullscreen', True)
             self.hide_controls()
         else:
-            self.root.attributes('-fullscreen', False)
-            if self.normal_geometry:
-                self.root.geometry(self.normal_geometry)
+            self.root.tk.call('wm', 'attributes', self.root._w, '-fullscreen', False)
+            self.root.geometry(
+                self.normal_geometry or self.settings.get('window', 'default_size', '1200x800')
+            )
             self.show_controls()
     
     def toggle_always_on_top(self):
         """Toggle always on top"""
-        current = self.root.attributes('-topmost')
-        self.root.attributes('-topmost', not current)
+        root = self.root
+        current = root.tk.getboolean(root.tk.call('wm', 'attributes', root._w, '-topmost'))
+        root.tk.call('wm', 'attributes', root._w, '-topmost', not current)
     
     def toggle_controls(self):
         """Toggle controls visibility"""
@@ -455,27 +658,36 @@ class MainWindow:
     
     def show_about(self):
         """Show about dialog"""
-        AboutDialog(self.root)
+        self._show_cached_dialog('about', lambda: AboutDialog(self.root))
     
     def show_settings(self):
         """Show settings dialog"""
-        SettingsDialog(self.root, self.settings)
+        self._show_cached_dialog(
+            'settings',
+            lambda: SettingsDialog(
+                self.root,
+                self.settings,
+                on_apply=self.reload_settings,
+                save_settings=self._schedule_settings_save
+            )
+        )
+    
+    def _show_cached_dialog(self, name, factory):
+        """Show a cached dialog, creating it on first use"""
+        dialog = self._dialog_cache.get(name)
+        if dialog and dialog.dialog.winfo_exists():
+            dialog.show()
+        else:
+            self._dialog_cache[name] = factory()
     
     def show_shortcuts(self):
         """Show keyboard shortcuts dialog"""
-        shortcuts = [
-            ("Space", "Play/Pause"),
-            ("F", "Toggle Fullscreen"),
-            ("C", "Show/Hide Controls"),
-            ("S", "Stop"),
-            ("M", "Mute/Unmute"),
-            ("↑/↓", "Volume Up/Down"),
-            ("←/→", "Seek Backward/Forward"),
-            ("N", "Next Video"),
-            ("P", "Previous Video"),
-            ("Ctrl+O", "Open File"),
-            ("Ctrl+Q", "Quit")
-        ]
+        dialog = self._shortcuts_dialog
+        if dialog and dialog.winfo_exists():
+            dialog.deiconify()
+            dialog.lift()
+            dialog.grab_set()
+            return
         
         dialog = tk.Toplevel(self.root)
         dialog.title("Keyboard Shortcuts")
@@ -486,10 +698,13 @@ class MainWindow:
         dialog.transient(self.root)
         dialog.grab_set()
         
+        # Hide instead of destroying so the dialog can be reused
+        dialog.protocol("WM_DELETE_WINDOW", self._hide_shortcuts)
+        
         frame = ttk.Frame(dialog, padding="20")
         frame.pack(fill=tk.BOTH, expand=True)
         
-        for i, (key, action) in enumerate(shortcuts):
+        for i, (key, action) in enumerate(_SHORTCUTS):
             ttk.Label(frame, text=key, font=('Courier', 10, 'bold')).grid(
                 row=i, column=0, sticky='w', padx=(0, 20), pady=2
             )
@@ -497,9 +712,16 @@ class MainWindow:
                 row=i, column=1, sticky='w', pady=2
             )
         
-        ttk.Button(frame, text="Close", command=dialog.destroy).grid(
-            row=len(shortcuts), column=0, columnspan=2, pady=20
+        ttk.Button(frame, text="Close", command=self._hide_shortcuts).grid(
+            row=len(_SHORTCUTS), column=0, columnspan=2, pady=20
         )
+        
+        self._shortcuts_dialog = dialog
+    
+    def _hide_shortcuts(self):
+        """Hide the keyboard shortcuts dialog"""
+        self._shortcuts_dialog.grab_release()
+        self._shortcuts_dialog.withdraw()
     
     def cleanup(self):
         """Cleanup resources before closing"""
@@ -510,6 +732,17 @@ class MainWindow:
             if self.auto_hide_timer:
                 self.root.after_cancel(self.auto_hide_timer)
             
+            if self._io_pump_timer:
+                self.root.after_cancel(self._io_pump_timer)
+            self._io_executor.shutdown(wait=False, cancel_futures=True)
+            
+            # Write out any pending debounced save
+            if self._settings_save_timer:
+                self.root.after_cancel(self._settings_save_timer)
+                self._flush_settings_save()
+            
+            self.keyboard_handler.clear_bindings(self.root)
+            
             self.logger.info("Main window cleanup completed")
             
         except Exception as e:
@@ -2,7 +2,10 @@
 Modern styling for the video player interface
 """
 
+import sys
+import time
 import tkinter as tk
+from types import SimpleNamespace
 from tkinter import ttk
 
 # Color scheme
@@ -20,286 +23,283 @@ COLORS = {
     'error': '#dc3545',           # Error red
 }
 
-def apply_modern_style(root):
-    """Apply modern styling to the application"""
-    
-    # Configure root window
-    root.configure(bg=COLORS['bg_primary'])
-    
-    # Create and configure custom style
-    style = ttk.Style()
+# Interned colors with attribute access (PALETTE.accent == COLORS['accent'])
+PALETTE = SimpleNamespace(**{name: sys.intern(value) for name, value in COLORS.items()})
+
+# ttk style options, resolved once at import
+_STYLE_TABLE = {
+    # General styles
+    '.': {
+        'background': PALETTE.bg_primary,
+        'foreground': PALETTE.fg_primary,
+        'bordercolor': PALETTE.border,
+        'focuscolor': PALETTE.accent,
+        'selectbackground': PALETTE.accent,
+        'selectforeground': PALETTE.fg_primary,
+    },
     
-    # Use 'clam' theme as base
-    style.theme_use('clam')
+    # Frame styles
+    'TFrame': {
+        'background': PALETTE.bg_primary,
+        'borderwidth': 0,
+        'relief': 'flat',
+    },
+    'Controls.TFrame': {
+        'background': PALETTE.bg_secondary,
+        'borderwidth': 1,
+        'relief': 'solid',
+    },
     
-    # Configure general styles
-    style.configure('.',
-        background=COLORS['bg_primary'],
-        foreground=COLORS['fg_primary'],
-        bordercolor=COLORS['border'],
-        focuscolor=COLORS['accent'],
-        selectbackground=COLORS['accent'],
-        selectforeground=COLORS['fg_primary']
-    )
+    # Label styles
+    'TLabel': {
+        'background': PALETTE.bg_primary,
+        'foreground': PALETTE.fg_primary,
+        'font': ('Segoe UI', 9),
+    },
+    'Time.TLabel': {
+        'background': PALETTE.bg_secondary,
+        'foreground': PALETTE.fg_secondary,
+        'font': ('Consolas', 9),
+    },
+    'Title.TLabel': {
+        'background': PALETTE.bg_primary,
+        'foreground': PALETTE.fg_primary,
+        'font': ('Segoe UI', 12, 'bold'),
+    },
     
-    # Frame styles
-    style.configure('TFrame',
-        background=COLORS['bg_primary'],
-        borderwidth=0,
-        relief='flat'
-    )
+    # Button styles
+    'TButton': {
+        'background': PALETTE.bg_tertiary,
+        'foreground': PALETTE.fg_primary,
+        'borderwidth': 1,
+        'relief': 'flat',
+        'padding': (10, 5),
+        'font': ('Segoe UI', 9),
+    },
+    'Control.TButton': {
+        'background': PALETTE.bg_tertiary,
+        'foreground': PALETTE.fg_primary,
+        'borderwidth': 1,
+        'relief': 'flat',
+        'padding': (8, 4),
+        'font': ('Segoe UI', 11),
+    },
     
-    style.configure('Controls.TFrame',
-        background=COLORS['bg_secondary'],
-        borderwidth=1,
-        relief='solid'
-    )
+    # Scale (slider) styles
+    'TScale': {
+        'background': PALETTE.bg_secondary,
+        'troughcolor': PALETTE.bg_tertiary,
+        'borderwidth': 0,
+        'lightcolor': PALETTE.accent,
+        'darkcolor': PALETTE.accent,
+    },
+    'Horizontal.TScale': {
+        'background': PALETTE.bg_secondary,
+        'troughcolor': PALETTE.bg_tertiary,
+        'borderwidth': 0,
+        'sliderthickness': 20,
+        'gripcount': 0,
+    },
     
-    # Label styles
-    style.configure('TLabel',
-        background=COLORS['bg_primary'],
-        foreground=COLORS['fg_primary'],
-        font=('Segoe UI', 9)
-    )
+    # Progress bar styles
+    'TProgressbar': {
+        'background': PALETTE.accent,
+        'troughcolor': PALETTE.bg_tertiary,
+        'borderwidth': 0,
+        'lightcolor': PALETTE.accent,
+        'darkcolor': PALETTE.accent,
+    },
     
-    style.configure('Time.TLabel',
-        background=COLORS['bg_secondary'],
-        foreground=COLORS['fg_secondary'],
-        font=('Consolas', 9)
-    )
+    # Entry styles
+    'TEntry': {
+        'fieldbackground': PALETTE.bg_tertiary,
+        'background': PALETTE.bg_tertiary,
+        'foreground': PALETTE.fg_primary,
+        'bordercolor': PALETTE.border,
+        'insertcolor': PALETTE.fg_primary,
+        'selectbackground': PALETTE.accent,
+        'selectforeground': PALETTE.fg_primary,
+    },
+    
+    # Checkbutton and radiobutton styles
+    'TCheckbutton': {
+        'background': PALETTE.bg_primary,
+        'foreground': PALETTE.fg_primary,
+        'focuscolor': PALETTE.accent,
+        'font': ('Segoe UI', 9),
+    },
+    'TRadiobutton': {
+        'background': PALETTE.bg_primary,
+        'foreground': PALETTE.fg_primary,
+        'focuscolor': PALETTE.accent,
+        'font': ('Segoe UI', 9),
+    },
     
-    style.configure('Title.TLabel',
-        background=COLORS['bg_primary'],
-        foreground=COLORS['fg_primary'],
-        font=('Segoe UI', 12, 'bold')
-    )
+    # Combobox styles
+    'TCombobox': {
+        'fieldbackground': PALETTE.bg_tertiary,
+        'background': PALETTE.bg_tertiary,
+        'foreground': PALETTE.fg_primary,
+        'bordercolor': PALETTE.border,
+        'selectbackground': PALETTE.accent,
+        'selectforeground': PALETTE.fg_primary,
+        'font': ('Segoe UI', 9),
+    },
     
-    # Button styles
-    style.configure('TButton',
-        background=COLORS['bg_tertiary'],
-        foreground=COLORS['fg_primary'],
-        borderwidth=1,
-        relief='flat',
-        padding=(10, 5),
-        font=('Segoe UI', 9)
-    )
+    # Notebook (tab) styles
+    'TNotebook': {
+        'background': PALETTE.bg_primary,
+        'borderwidth': 0,
+    },
+    'TNotebook.Tab': {
+        'background': PALETTE.bg_tertiary,
+        'foreground': PALETTE.fg_secondary,
+        'padding': [20, 8],
+        'font': ('Segoe UI', 9),
+    },
     
-    style.map('TButton',
-        background=[
-            ('active', COLORS['accent']),
-            ('pressed', COLORS['accent_hover'])
+    # Treeview styles
+    'Treeview': {
+        'background': PALETTE.bg_secondary,
+        'foreground': PALETTE.fg_primary,
+        'fieldbackground': PALETTE.bg_secondary,
+        'selectbackground': PALETTE.accent,
+        'selectforeground': PALETTE.fg_primary,
+        'font': ('Segoe UI', 9),
+    },
+    'Treeview.Heading': {
+        'background': PALETTE.bg_tertiary,
+        'foreground': PALETTE.fg_primary,
+        'font': ('Segoe UI', 9, 'bold'),
+    },
+}
+
+# ttk state-dependent style options, resolved once at import
+_STYLE_MAPS = {
+    'TButton': {
+        'background': [
+            ('active', PALETTE.accent),
+            ('pressed', PALETTE.accent_hover)
         ],
-        foreground=[
-            ('active', COLORS['fg_primary']),
-            ('pressed', COLORS['fg_primary'])
+        'foreground': [
+            ('active', PALETTE.fg_primary),
+            ('pressed', PALETTE.fg_primary)
         ],
-        relief=[
+        'relief': [
             ('pressed', 'flat'),
             ('!pressed', 'flat')
-        ]
-    )
-    
-    # Control button styles (smaller)
-    style.configure('Control.TButton',
-        background=COLORS['bg_tertiary'],
-        foreground=COLORS['fg_primary'],
-        borderwidth=1,
-        relief='flat',
-        padding=(8, 4),
-        font=('Segoe UI', 11)
-    )
-    
-    style.map('Control.TButton',
-        background=[
-            ('active', COLORS['accent']),
-            ('pressed', COLORS['accent_hover']),
-            ('disabled', COLORS['bg_secondary'])
         ],
-        foreground=[
-            ('active', COLORS['fg_primary']),
-            ('pressed', COLORS['fg_primary']),
-            ('disabled', COLORS['fg_secondary'])
-        ]
-    )
-    
-    # Scale (slider) styles
-    style.configure('TScale',
-        background=COLORS['bg_secondary'],
-        troughcolor=COLORS['bg_tertiary'],
-        borderwidth=0,
-        lightcolor=COLORS['accent'],
-        darkcolor=COLORS['accent']
-    )
-    
-    style.configure('Horizontal.TScale',
-        background=COLORS['bg_secondary'],
-        troughcolor=COLORS['bg_tertiary'],
-        borderwidth=0,
-        sliderthickness=20,
-        gripcount=0
-    )
-    
-    style.map('Horizontal.TScale',
-        background=[
-            ('active', COLORS['accent']),
-            ('!active', COLORS['bg_tertiary'])
+    },
+    'Control.TButton': {
+        'background': [
+            ('active', PALETTE.accent),
+            ('pressed', PALETTE.accent_hover),
+            ('disabled', PALETTE.bg_secondary)
         ],
-        troughcolor=[
-            ('focus', COLORS['bg_tertiary']),
-            ('!focus', COLORS['bg_tertiary'])
-        ]
-    )
-    
-    # Progress bar styles
-    style.configure('TProgressbar',
-        background=COLORS['accent'],
-        troughcolor=COLORS['bg_tertiary'],
-        borderwidth=0,
-        lightcolor=COLORS['accent'],
-        darkcolor=COLORS['accent']
-    )
-    
-    # Entry styles
-    style.configure('TEntry',
-        fieldbackground=COLORS['bg_tertiary'],
-        background=COLORS['bg_tertiary'],
-        foreground=COLORS['fg_primary'],
-        bordercolor=COLORS['border'],
-        insertcolor=COLORS['fg_primary'],
-        selectbackground=COLORS['accent'],
-        selectforeground=COLORS['fg_primary']
-    )
-    
-    style.map('TEntry',
-        fieldbackground=[
-            ('focus', COLORS['bg_secondary']),
-            ('!focus', COLORS['bg_tertiary'])
+        'foreground': [
+            ('active', PALETTE.fg_primary),
+            ('pressed', PALETTE.fg_primary),
+            ('disabled', PALETTE.fg_secondary)
         ],
-        bordercolor=[
-            ('focus', COLORS['accent']),
-            ('!focus', COLORS['border'])
-        ]
-    )
-    
-    # Checkbutton styles
-    style.configure('TCheckbutton',
-        background=COLORS['bg_primary'],
-        foreground=COLORS['fg_primary'],
-        focuscolor=COLORS['accent'],
-        font=('Segoe UI', 9)
-    )
-    
-    style.map('TCheckbutton',
-        background=[
-            ('active', COLORS['bg_primary']),
-            ('pressed', COLORS['bg_primary'])
+    },
+    'Horizontal.TScale': {
+        'background': [
+            ('active', PALETTE.accent),
+            ('!active', PALETTE.bg_tertiary)
         ],
-        foreground=[
-            ('active', COLORS['accent']),
-            ('pressed', COLORS['accent'])
-        ]
-    )
-    
-    # Radiobutton styles
-    style.configure('TRadiobutton',
-        background=COLORS['bg_primary'],
-        foreground=COLORS['fg_primary'],
-        focuscolor=COLORS['accent'],
-        font=('Segoe UI', 9)
-    )
-    
-    style.map('TRadiobutton',
-        background=[
-            ('active', COLORS['bg_primary']),
-            ('pressed', COLORS['bg_primary'])
+        'troughcolor': [
+            ('focus', PALETTE.bg_tertiary),
+            ('!focus', PALETTE.bg_tertiary)
         ],
-        foreground=[
-            ('active', COLORS['accent']),
-            ('pressed', COLORS['accent'])
-        ]
-    )
-    
-    # Combobox styles
-    style.configure('TCombobox',
-        fieldbackground=COLORS['bg_tertiary'],
-        background=COLORS['bg_tertiary'],
-        foreground=COLORS['fg_primary'],
-        bordercolor=COLORS['border'],
-        selectbackground=COLORS['accent'],
-        selectforeground=COLORS['fg_primary'],
-        font=('Segoe UI', 9)
-    )
-    
-    style.map('TCombobox',
-        fieldbackground=[
-            ('focus', COLORS['bg_secondary']),
-            ('!focus', COLORS['bg_tertiary'])
+    },
+    'TEntry': {
+        'fieldbackground': [
+            ('focus', PALETTE.bg_secondary),
+            ('!focus', PALETTE.bg_tertiary)
         ],
-        bordercolor=[
-            ('focus', COLORS['accent']),
-            ('!focus', COLORS['border'])
-        ]
-    )
-    
-    # Notebook (tab) styles
-    style.configure('TNotebook',
-        background=COLORS['bg_primary'],
-        borderwidth=0
-    )
+        'bordercolor': [
+            ('focus', PALETTE.accent),
+            ('!focus', PALETTE.border)
+        ],
+    },
+    'TCheckbutton': {
+        'background': [
+            ('active', PALETTE.bg_primary),
+            ('pressed', PALETTE.bg_primary)
+        ],
+        'foreground': [
+            ('active', PALETTE.accent),
+            ('pressed', PALETTE.accent)
+        ],
+    },
+    'TRadiobutton': {
+        'background': [
+            ('active', PALETTE.bg_primary),
+            ('pressed', PALETTE.bg_primary)
+        ],
+        'foreground': [
+            ('active', PALETTE.accent),
+            ('pressed', PALETTE.accent)
+        ],
+    },
+    'TCombobox': {
+        'fieldbackground': [
+            ('focus', PALETTE.bg_secondary),
+            ('!focus', PALETTE.bg_tertiary)
+        ],
+        'bordercolor': [
+            ('focus', PALETTE.accent),
+            ('!focus', PALETTE.border)
+        ],
+    },
+    'TNotebook.Tab': {
+        'background': [
+            ('selected', PALETTE.bg_primary),
+            ('active', PALETTE.bg_secondary),
+            ('!selected', PALETTE.bg_tertiary)
+        ],
+        'foreground': [
+            ('selected', PALETTE.fg_primary),
+            ('active', PALETTE.fg_primary),
+            ('!selected', PALETTE.fg_secondary)
+        ],
+    },
+    'Treeview.Heading': {
+        'background': [
+            ('active', PALETTE.accent),
+            ('pressed', PALETTE.accent_hover)
+        ],
+    },
+}
+
+def apply_modern_style(root):
+    """Apply modern styling to the application"""
     
-    style.configure('TNotebook.Tab',
-        background=COLORS['bg_tertiary'],
-        foreground=COLORS['fg_secondary'],
-        padding=[20, 8],
-        font=('Segoe UI', 9)
-    )
+    # Configure root window
+    root.configure(bg=PALETTE.bg_primary)
     
-    style.map('TNotebook.Tab',
-        background=[
-            ('selected', COLORS['bg_primary']),
-            ('active', COLORS['bg_secondary']),
-            ('!selected', COLORS['bg_tertiary'])
-        ],
-        foreground=[
-            ('selected', COLORS['fg_primary']),
-            ('active', COLORS['fg_primary']),
-            ('!selected', COLORS['fg_secondary'])
-        ]
-    )
+    # Create and configure custom style
+    style = ttk.Style()
     
-    # Treeview styles
-    style.configure('Treeview',
-        background=COLORS['bg_secondary'],
-        foreground=COLORS['fg_primary'],
-        fieldbackground=COLORS['bg_secondary'],
-        selectbackground=COLORS['accent'],
-        selectforeground=COLORS['fg_primary'],
-        font=('Segoe UI', 9)
-    )
+    # Use 'clam' theme as base
+    style.theme_use('clam')
     
-    style.configure('Treeview.Heading',
-        background=COLORS['bg_tertiary'],
-        foreground=COLORS['fg_primary'],
-        font=('Segoe UI', 9, 'bold')
-    )
+    for name, options in _STYLE_TABLE.items():
+        style.configure(name, **options)
     
-    style.map('Treeview.Heading',
-        background=[
-            ('active', COLORS['accent']),
-            ('pressed', COLORS['accent_hover'])
-        ]
-    )
+    for name, options in _STYLE_MAPS.items():
+        style.map(name, **options)
 
 def create_loading_widget(parent, text="Loading..."):
     """Create a loading widget with spinner"""
-    frame = tk.Frame(parent, bg=COLORS['bg_primary'])
+    frame = tk.Frame(parent, bg=PALETTE.bg_primary)
     
     # Loading label
     label = tk.Label(
         frame,
         text=text,
-        bg=COLORS['bg_primary'],
-        fg=COLORS['fg_secondary'],
+        bg=PALETTE.bg_primary,
+        fg=PALETTE.fg_secondary,
         font=('Segoe UI', 10)
     )
     label.pack(pady=10)
@@ -317,14 +317,14 @@ def create_loading_widget(parent, text="Loading..."):
 
 def create_error_widget(parent, message, retry_callback=None):
     """Create an error display widget"""
-    frame = tk.Frame(parent, bg=COLORS['bg_primary'])
+    frame = tk.Frame(parent, bg=PALETTE.bg_primary)
     
     # Error icon (using text)
     icon_label = tk.Label(
         frame,
         text="⚠",
-        bg=COLORS['bg_primary'],
-        fg=COLORS['error'],
+        bg=PALETTE.bg_primary,
+        fg=PALETTE.error,
         font=('Segoe UI', 24)
     )
     icon_label.pack(pady=10)
@@ -333,8 +333,8 @@ def create_error_widget(parent, message, retry_callback=None):
     message_label = tk.Label(
         frame,
         text=message,
-        bg=COLORS['bg_primary'],
-        fg=COLORS['fg_primary'],
+        bg=PALETTE.bg_primary,
+        fg=PALETTE.fg_primary,
         font=('Segoe UI', 10),
         wraplength=300,
         justify='center'
@@ -352,46 +352,65 @@ def create_error_widget(parent, message, retry_callback=None):
     
     return frame
 
-def animate_widget_fade_in(widget, duration=500, steps=20):
-    """Animate widget fade in effect"""
-    def fade_step(step):
-        alpha = step / steps
-        try:
-            widget.attributes('-alpha', alpha)
-            if step < steps:
-                widget.after(duration // steps, lambda: fade_step(step + 1))
-        except tk.TclError:
-            pass  # Widget destroyed
-    
-    widget.attributes('-alpha', 0)
-    fade_step(0)
+def animate_widget_fade_in(widget, duration=500, steps=None, interval=16):
+    """Animate widget fade in effect
+    
+    steps is still accepted for older callers and sets the frame interval
+    to duration // steps; progress always follows elapsed time.
+    """
+    # Call 'wm attributes' directly to skip the Wm.attributes wrapper per frame
+    tk_call = widget.tk.call
+    path = widget._w
+    
+    if duration <= 0:
+        tk_call('wm', 'attributes', path, '-alpha', 1.0)
+        return
+    
+    if steps:
+        interval = max(1, duration // steps)
+    
+    start = time.monotonic()
+    duration_s = duration / 1000
+    
+    def fade_step():
+        if not widget.winfo_exists():
+            return  # Widget destroyed
+        
+        # Progress follows wall-clock time, so timer jitter doesn't skew it
+        alpha = min(1.0, (time.monotonic() - start) / duration_s)
+        tk_call('wm', 'attributes', path, '-alpha', alpha)
+        if alpha < 1.0:
+            widget.after(interval, fade_step)
+    
+    tk_call('wm', 'attributes', path, '-alpha', 0)
+    fade_step()
 
-def animate_widget_slide_in(widget, direction='up', duration=300, distance=50):
+def animate_widget_slide_in(widget, direction='up', duration=300, distance=50, interval=16):
     """Animate widget slide in effect"""
     original_y = widget.winfo_y()
     
     if direction == 'up':
         start_y = original_y + distance
+        sign = -1
     else:
         start_y = original_y - distance
+        sign = 1
+    
+    if duration <= 0:
+        widget.place(y=start_y + sign * distance)
+        return
+    
+    start = time.monotonic()
+    duration_s = duration / 1000
     
-    steps = 20
-    step_distance = distance / steps
-    step_time = duration // steps
-    
-    def slide_step(step):
-        if step <= steps:
-            if direction == 'up':
-                y = start_y - (step * step_distance)
-            else:
-                y = start_y + (step * step_distance)
-            
-            try:
-                widget.place(y=y)
-                if step < steps:
-                    widget.after(step_time, lambda: slide_step(step + 1))
-            except tk.TclError:
-                pass  # Widget destroyed
+    def slide_step():
+        if not widget.winfo_exists():
+            return  # Widget destroyed
+        
+        progress = min(1.0, (time.monotonic() - start) / duration_s)
+        widget.place(y=start_y + sign * progress * distance)
+        if progress < 1.0:
+            widget.after(interval, slide_step)
     
     widget.place(y=start_y)
-    slide_step(0)
+    slide_step()
@@ -3,26 +3,116 @@ File management utilities for the video player
 """
 
 import os
+import sys
+import stat
+import errno
+import time
+import uuid
 import shutil
 import mimetypes
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path, PurePath
 from typing import List, Optional, Dict, Union
 import json
 
 from utils.logger import Logger
 
+def _extension(file_path: Union[str, Path]) -> str:
+    """Lower-cased extension of a path, without building a Path for strings"""
+    if isinstance(file_path, PurePath):
+        return file_path.suffix.lower()
+    return os.path.splitext(file_path)[1].lower()
+
+@dataclass
+class FileInfo:
+    """File information returned by FileManager.get_file_info
+    
+    parent and absolute_path are only computed when first read. The
+    read-only mapping protocol (info['name'], info.get(...), 'name' in info,
+    iteration, len() and dict(info)) is kept for callers written against
+    the previous dict return value.
+    """
+    name: str
+    stem: str
+    suffix: str
+    size: int
+    size_mb: float
+    modified: float
+    created: float
+    is_file: bool
+    is_dir: bool
+    mime_type: Optional[str]
+    category: str
+    _path: Path = field(repr=False, compare=False)
+    
+    # Keys of the former dict, in order; a dict view so keys() is set-like
+    _KEYS = dict.fromkeys(('name', 'stem', 'suffix', 'size', 'size_mb', 'modified', 'created',
+                           'is_file', 'is_dir', 'parent', 'absolute_path', 'mime_type', 'category')).keys()
+    
+    @cached_property
+    def parent(self) -> str:
+        return str(self._path.parent)
+    
+    @cached_property
+    def absolute_path(self) -> str:
+        return str(self._path.absolute())
+    
+    def keys(self):
+        return self._KEYS
+    
+    def __getitem__(self, key: str):
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def get(self, key: str, default=None):
+        return getattr(self, key, default) if key in self._KEYS else default
+    
+    def __contains__(self, key) -> bool:
+        return key in self._KEYS
+    
+    def __iter__(self):
+        return iter(self._KEYS)
+    
+    def __len__(self) -> int:
+        return len(self._KEYS)
+    
+    def as_dict(self) -> Dict:
+        """Materialize all fields, including the lazy ones"""
+        return {key: getattr(self, key) for key in self._KEYS}
+
 class FileManager:
     """File operations and management"""
     
+    # Directory size above which scan_media_directory may stat in parallel
+    PARALLEL_SCAN_THRESHOLD = 64
+    PARALLEL_SCAN_WORKERS = 16
+    
+    # Fixed file type mappings; frozensets of interned strings
+    audio_extensions = frozenset(map(sys.intern, ('.mp3', '.wav', '.ogg', '.m4a', '.flac', '.aac')))
+    subtitle_extensions = frozenset(map(sys.intern, ('.srt', '.vtt', '.ass', '.ssa', '.sub', '.idx')))
+    
+    # Extension tables built by _load_supported_formats, keyed by format tuple
+    _FORMAT_CACHE = {}
+    
+    # Extension -> MIME type, filled by _mime_type
+    _MIME_CACHE = {}
+    
+    # Units used by format_file_size, one per power of 1024
+    _SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+    
+    # Deletes characters that are invalid in Windows/Unix filenames
+    _SAFE_FILENAME_TABLE = str.maketrans('', '', '<>:"/\\|?*')
+    
     def __init__(self, settings):
         """Initialize file manager"""
         self.settings = settings
         self.logger = Logger.get_logger()
         
-        # File type mappings
-        self.video_extensions = set()
-        self.audio_extensions = {'.mp3', '.wav', '.ogg', '.m4a', '.flac', '.aac'}
-        self.subtitle_extensions = {'.srt', '.vtt', '.ass', '.ssa', '.sub', '.idx'}
+        # File type mappings (audio and subtitle ones are class-level)
+        self.video_extensions = frozenset()
         
         # Load supported formats
         self._load_supported_formats()
@@ -32,31 +122,66 @@ class FileManager:
     def _load_supported_formats(self):
         """Load supported video formats from settings"""
         formats = self.settings.get_supported_formats()
-        self.video_extensions = {f'.{fmt}' for fmt in formats}
+        key = tuple(sorted(formats))
+        
+        # Instances with the same formats share the (read-only) tables
+        cached = self._FORMAT_CACHE.get(key)
+        if cached is None:
+            video_extensions = frozenset(sys.intern(f'.{fmt.lower()}') for fmt in formats)
+            
+            # Extension -> category table; later updates win, so video takes
+            # precedence over audio and subtitle as in the is_*_file checks
+            ext_category = dict.fromkeys(self.subtitle_extensions, 'subtitle')
+            ext_category.update(dict.fromkeys(self.audio_extensions, 'audio'))
+            ext_category.update(dict.fromkeys(video_extensions, 'video'))
+            
+            cached = self._FORMAT_CACHE[key] = (video_extensions, ext_category)
+        
+        self.video_extensions, self._ext_category = cached
+        
+        # Pre-populate MIME types for all known media extensions
+        for extension in self._ext_category:
+            self._mime_type(extension)
+    
+    def _scandir_recursive(self, path: Union[str, Path]):
+        """Yield file entries under path, descending into subdirectories"""
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    # Symlinked directories are not followed, matching Path.glob('**')
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from self._scandir_recursive(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError:
+            # Unreadable or vanished directory
+            pass
     
     def get_video_files(self, directory: Union[str, Path], recursive: bool = False) -> List[Path]:
         """Get all video files from directory"""
         try:
             directory = Path(directory)
             
-            if not directory.exists() or not directory.is_dir():
+            if not directory.is_dir():
                 self.logger.warning(f"Directory not found: {directory}")
                 return []
             
-            video_files = []
-            
+            # DirEntry caches the file type from readdir, avoiding a stat per entry
             if recursive:
-                pattern = "**/*"
-                paths = directory.glob(pattern)
+                entries = self._scandir_recursive(directory)
             else:
-                paths = directory.iterdir()
+                with os.scandir(directory) as it:
+                    entries = [entry for entry in it if entry.is_file()]
             
-            for path in paths:
-                if path.is_file() and self.is_video_file(path):
-                    video_files.append(path)
+            video_extensions = self.video_extensions
+            keyed = [
+                (entry.name.lower(), entry.path) for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in video_extensions
+            ]
             
-            # Sort naturally
-            video_files.sort(key=lambda x: x.name.lower())
+            # Sort naturally, on names lowered once while collecting
+            keyed.sort()
+            video_files = [Path(path) for _, path in keyed]
             
             self.logger.debug(f"Found {len(video_files)} video files in {directory}")
             return video_files
@@ -67,36 +192,15 @@ class FileManager:
     
     def is_video_file(self, file_path: Union[str, Path]) -> bool:
         """Check if file is a supported video file"""
-        try:
-            file_path = Path(file_path)
-            extension = file_path.suffix.lower()
-            return extension in self.video_extensions
-            
-        except Exception as e:
-            self.logger.error(f"Error checking video file: {e}")
-            return False
+        return _extension(file_path) in self.video_extensions
     
     def is_audio_file(self, file_path: Union[str, Path]) -> bool:
         """Check if file is an audio file"""
-        try:
-            file_path = Path(file_path)
-            extension = file_path.suffix.lower()
-            return extension in self.audio_extensions
-            
-        except Exception as e:
-            self.logger.error(f"Error checking audio file: {e}")
-            return False
+        return _extension(file_path) in self.audio_extensions
     
     def is_subtitle_file(self, file_path: Union[str, Path]) -> bool:
         """Check if file is a subtitle file"""
-        try:
-            file_path = Path(file_path)
-            extension = file_path.suffix.lower()
-            return extension in self.subtitle_extensions
-            
-        except Exception as e:
-            self.logger.error(f"Error checking subtitle file: {e}")
-            return False
+        return _extension(file_path) in self.subtitle_extensions
     
     def find_subtitle_files(self, video_path: Union[str, Path]) -> List[Path]:
         """Find subtitle files for a video"""
@@ -105,21 +209,31 @@ class FileManager:
             video_dir = video_path.parent
             video_stem = video_path.stem
             
-            subtitle_files = []
-            
-            # Look for subtitle files with same name
-            for subtitle_ext in self.subtitle_extensions:
-                subtitle_path = video_dir / f"{video_stem}{subtitle_ext}"
-                if subtitle_path.exists():
-                    subtitle_files.append(subtitle_path)
+            # Files with the same name come first, then ones with language
+            # codes or other suffixes (e.g. movie.en.srt)
+            exact_matches = []
+            other_matches = []
+            
+            # A single directory read instead of probing each candidate
+            # name with exists(), so per-open security hooks run once
+            with os.scandir(video_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    if not name.startswith(video_stem):
+                        continue
+                    
+                    stem, ext = os.path.splitext(name)
+                    if ext.lower() not in self.subtitle_extensions or not stem.startswith(video_stem):
+                        continue
+                    if not entry.is_file():
+                        continue
+                    
+                    if stem == video_stem:
+                        exact_matches.append(Path(entry.path))
+                    else:
+                        other_matches.append(Path(entry.path))
             
-            # Look for subtitle files with language codes
-            for file_path in video_dir.iterdir():
-                if (file_path.is_file() and 
-                    file_path.stem.startswith(video_stem) and 
-                    file_path.suffix.lower() in self.subtitle_extensions):
-                    if file_path not in subtitle_files:
-                        subtitle_files.append(file_path)
+            subtitle_files = exact_matches + other_matches
             
             self.logger.debug(f"Found {len(subtitle_files)} subtitle files for {video_path}")
             return subtitle_files
@@ -128,85 +242,97 @@ class FileManager:
             self.logger.error(f"Error finding subtitle files: {e}")
             return []
     
-    def get_file_info(self, file_path: Union[str, Path]) -> Dict:
-        """Get detailed file information"""
+    def get_file_info(self, file_path: Union[str, Path], _stat_result: Optional[os.stat_result] = None) -> Optional[FileInfo]:
+        """Get detailed file information, or None if the file cannot be read
+        
+        Callers that already hold a stat result (e.g. from a DirEntry) can
+        pass it as _stat_result to skip the stat() call.
+        """
         try:
             file_path = Path(file_path)
             
-            if not file_path.exists():
-                return {}
-            
-            stat = file_path.stat()
-            
-            info = {
-                'name': file_path.name,
-                'stem': file_path.stem,
-                'suffix': file_path.suffix,
-                'size': stat.st_size,
-                'size_mb': round(stat.st_size / (1024 * 1024), 2),
-                'modified': stat.st_mtime,
-                'created': stat.st_ctime,
-                'is_file': file_path.is_file(),
-                'is_dir': file_path.is_dir(),
-                'parent': str(file_path.parent),
-                'absolute_path': str(file_path.absolute())
-            }
-            
-            # Add MIME type
-            mime_type, _ = mimetypes.guess_type(str(file_path))
-            info['mime_type'] = mime_type
-            
-            # Add file type category
-            if self.is_video_file(file_path):
-                info['category'] = 'video'
-            elif self.is_audio_file(file_path):
-                info['category'] = 'audio'
-            elif self.is_subtitle_file(file_path):
-                info['category'] = 'subtitle'
-            else:
-                info['category'] = 'other'
+            if _stat_result is None:
+                try:
+                    _stat_result = os.stat(file_path)
+                except OSError:
+                    return None
             
-            return info
+            return self._build_file_info(file_path, _stat_result)
             
         except Exception as e:
             self.logger.error(f"Error getting file info: {e}")
-            return {}
+            return None
+    
+    def _mime_type(self, extension: str) -> Optional[str]:
+        """Get the MIME type for a lower-cased extension, memoized per extension"""
+        try:
+            return self._MIME_CACHE[extension]
+        except KeyError:
+            mime_type = mimetypes.guess_type(f"file{extension}")[0]
+            self._MIME_CACHE[extension] = mime_type
+            return mime_type
+    
+    def _file_info_from_entry(self, entry: os.DirEntry) -> Optional[FileInfo]:
+        """Get file information for a scandir entry, reusing its stat result"""
+        try:
+            st = entry.stat()
+        except OSError as e:
+            self.logger.warning(f"Error processing item {entry.path}: {e}")
+            return None
+        
+        # Building the FileInfo cannot fail once stat() succeeded; scan callers
+        # keep a single outer try instead of one per file
+        return self._build_file_info(Path(entry.path), st)
+    
+    def _file_infos_from_entries(self, entries: List[os.DirEntry]) -> List[Optional[FileInfo]]:
+        """Get file information for many entries, optionally stat'ing in parallel
+        
+        Parallel stat() only pays off where each call has real latency
+        (network drives), so it is opt-in via performance.parallel_scan.
+        """
+        if (len(entries) > self.PARALLEL_SCAN_THRESHOLD and
+                self.settings.getboolean('performance', 'parallel_scan', False)):
+            with ThreadPoolExecutor(max_workers=self.PARALLEL_SCAN_WORKERS) as executor:
+                return list(executor.map(self._file_info_from_entry, entries))
+        
+        return [self._file_info_from_entry(entry) for entry in entries]
+    
+    def _build_file_info(self, file_path: Path, st: os.stat_result) -> FileInfo:
+        """Build the file information from a path and its stat result"""
+        suffix = file_path.suffix
+        extension = suffix.lower()
+        
+        return FileInfo(
+            name=file_path.name,
+            stem=file_path.stem,
+            suffix=suffix,
+            size=st.st_size,
+            size_mb=round(st.st_size / (1024 * 1024), 2),
+            modified=st.st_mtime,
+            created=st.st_ctime,
+            is_file=stat.S_ISREG(st.st_mode),
+            is_dir=stat.S_ISDIR(st.st_mode),
+            mime_type=self._mime_type(extension),
+            category=self._ext_category.get(extension, 'other'),
+            _path=file_path
+        )
     
     def format_file_size(self, size_bytes: int) -> str:
         """Format file size in human readable format"""
-        try:
-            if size_bytes < 1024:
-                return f"{size_bytes} B"
-            elif size_bytes < 1024 * 1024:
-                return f"{size_bytes / 1024:.1f} KB"
-            elif size_bytes < 1024 * 1024 * 1024:
-                return f"{size_bytes / (1024 * 1024):.1f} MB"
-            else:
-                return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
-                
-        except Exception as e:
-            self.logger.error(f"Error formatting file size: {e}")
-            return "Unknown"
+        # Each unit spans 10 bits, so bit_length picks the unit directly
+        index = min(max(int(size_bytes).bit_length() - 1, 0) // 10, len(self._SIZE_UNITS) - 1)
+        if index == 0:
+            return f"{size_bytes} B"
+        return f"{size_bytes / (1 << (10 * index)):.1f} {self._SIZE_UNITS[index]}"
     
     def get_safe_filename(self, filename: str) -> str:
         """Get safe filename by removing invalid characters"""
-        try:
-            # Remove invalid characters for Windows/Unix
-            invalid_chars = '<>:"/\\|?*'
-            safe_name = ''.join(c for c in filename if c not in invalid_chars)
-            
-            # Remove leading/trailing spaces and dots
-            safe_name = safe_name.strip(' .')
-            
-            # Ensure it's not empty
-            if not safe_name:
-                safe_name = "untitled"
-            
-            return safe_name
-            
-        except Exception as e:
-            self.logger.error(f"Error creating safe filename: {e}")
-            return "untitled"
+        # Remove invalid characters for Windows/Unix, then leading/trailing
+        # spaces and dots
+        safe_name = filename.translate(self._SAFE_FILENAME_TABLE).strip(' .')
+        
+        # Ensure it's not empty
+        return safe_name or "untitled"
     
     def create_directory(self, directory: Union[str, Path]) -> bool:
         """Create directory if it doesn't exist"""
@@ -230,11 +356,23 @@ class FileManager:
                 self.logger.error(f"Source file not found: {source}")
                 return False
             
+            # A directory destination receives the file under its own name, as with copy2
+            if destination.is_dir():
+                destination = destination / source.name
+            
+            # Opening the destination for writing would truncate the source itself
+            if destination.exists() and os.path.samefile(source, destination):
+                self.logger.error(f"Error copying file: {source} and {destination} are the same file")
+                return False
+            
             # Create destination directory if needed
             self.create_directory(destination.parent)
             
-            # Copy file
-            shutil.copy2(str(source), str(destination))
+            # Copy file, in-kernel where the platform allows it
+            if self._kernel_copy(source, destination):
+                shutil.copystat(str(source), str(destination))
+            else:
+                shutil.copy2(str(source), str(destination))
             self.logger.info(f"File copied: {source} -> {destination}")
             return True
             
@@ -242,6 +380,41 @@ class FileManager:
             self.logger.error(f"Error copying file: {e}")
             return False
     
+    def _kernel_copy(self, source: Path, destination: Path) -> bool:
+        """Copy file contents without a userspace buffer; False if unsupported"""
+        if sys.platform == 'win32':
+            import ctypes
+            return bool(ctypes.windll.kernel32.CopyFileExW(str(source), str(destination), None, None, None, 0))
+        
+        if not hasattr(os, 'copy_file_range'):
+            return False
+        
+        try:
+            fsrc = open(source, 'rb')
+        except OSError:
+            return False  # shutil.copy2 reports or works around it
+        
+        with fsrc:
+            try:
+                fdst = open(destination, 'wb')
+            except OSError:
+                return False
+            
+            with fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                try:
+                    while remaining > 0:
+                        copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                except OSError as e:
+                    if e.errno in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF):
+                        return False
+                    raise
+        
+        return remaining <= 0
+    
     def move_file(self, source: Union[str, Path], destination: Union[str, Path]) -> bool:
         """Move file to destination"""
         try:
@@ -286,35 +459,37 @@ class FileManager:
             return False
     
     def get_unique_filename(self, file_path: Union[str, Path]) -> Path:
-        """Get unique filename by adding number suffix if file exists"""
+        """Get unique filename by adding a suffix if file exists
+        
+        A timestamp/pid suffix is tried first so the common case needs a
+        single extra existence check; numbered names are the fallback.
+        """
         try:
             file_path = Path(file_path)
             
-            if not file_path.exists():
+            if not os.path.exists(file_path):
                 return file_path
             
             stem = file_path.stem
             suffix = file_path.suffix
             parent = file_path.parent
             
-            counter = 1
-            while True:
+            tag = f"{int(time.time() * 1000):x}_{os.getpid():x}"
+            candidate = parent / f"{stem}_{tag}{suffix}"
+            if not os.path.exists(candidate):
+                return candidate
+            
+            parent_str = str(parent)
+            for counter in range(1, 1001):
                 new_name = f"{stem} ({counter}){suffix}"
-                new_path = parent / new_name
-                
-                if not new_path.exists():
-                    return new_path
-                
-                counter += 1
-                
-                # Safety break
-                if counter > 1000:
-                    break
+                if not os.path.exists(os.path.join(parent_str, new_name)):
+                    return parent / new_name
             
-            # Fallback
-            import time
-            timestamp = int(time.time())
-            return parent / f"{stem}_{timestamp}{suffix}"
+            # Fallback: candidate is known to exist, so never return it
+            while True:
+                candidate = parent / f"{stem}_{uuid.uuid4().hex}{suffix}"
+                if not os.path.exists(candidate):
+                    return candidate
             
         except Exception as e:
             self.logger.error(f"Error creating unique filename: {e}")
@@ -338,38 +513,40 @@ class FileManager:
                 'total_files': 0
             }
             
-            for item in directory.iterdir():
+            with os.scandir(directory) as it:
+                entries = list(it)
+            
+            file_entries = []
+            for item in entries:
                 try:
                     if item.is_file():
-                        file_info = self.get_file_info(item)
-                        results['total_files'] += 1
-                        results['total_size'] += file_info.get('size', 0)
-                        
-                        if file_info.get('category') == 'video':
-                            results['video_files'].append(file_info)
-                        elif file_info.get('category') == 'audio':
-                            results['audio_files'].append(file_info)
-                        elif file_info.get('category') == 'subtitle':
-                            results['subtitle_files'].append(file_info)
-                        else:
-                            results['other_files'].append(file_info)
+                        file_entries.append(item)
                     
                     elif item.is_dir():
                         results['subdirectories'].append({
                             'name': item.name,
-                            'path': str(item),
-                            'absolute_path': str(item.absolute())
+                            'path': item.path,
+                            'absolute_path': os.path.abspath(item.path)
                         })
                 
                 except Exception as item_error:
                     self.logger.warning(f"Error processing item {item}: {item_error}")
                     continue
             
-            # Sort results
+            for file_info in self._file_infos_from_entries(file_entries):
+                # Files whose stat() failed still count, but have no details to list
+                results['total_files'] += 1
+                if file_info is None:
+                    continue
+                
+                results['total_size'] += file_info.size
+                results[f"{file_info.category}_files"].append(file_info)
+            
+            # sort() computes each key once, so the results are left untouched
             for category in ['video_files', 'audio_files', 'subtitle_files', 'other_files']:
-                results[category].sort(key=lambda x: x['name'].lower())
+                results[category].sort(key=lambda f: f.name.lower())
             
-            results['subdirectories'].sort(key=lambda x: x['name'].lower())
+            results['subdirectories'].sort(key=lambda d: d['name'].lower())
             
             self.logger.debug(f"Scanned directory {directory}: {results['total_files']} files, {len(results['subdirectories'])} subdirs")
             return results
@@ -382,33 +559,36 @@ class FileManager:
         """Export file list to various formats"""
         try:
             output_path = Path(output_path)
+            format = format.lower()
+            
+            if format not in ('json', 'txt', 'csv'):
+                self.logger.error(f"Unsupported export format: {format}")
+                return False
+            
             self.create_directory(output_path.parent)
             
-            file_data = []
-            for file_path in files:
-                file_info = self.get_file_info(file_path)
-                file_data.append(file_info)
+            # File info is produced and written one entry at a time; files
+            # that cannot be read are left out
+            file_infos = filter(None, (self.get_file_info(file_path) for file_path in files))
             
-            if format.lower() == 'json':
+            if format == 'json':
                 with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(file_data, f, indent=2, ensure_ascii=False, default=str)
+                    self._write_json_list(f, (dict(info) for info in file_infos))
             
-            elif format.lower() == 'txt':
+            elif format == 'txt':
                 with open(output_path, 'w', encoding='utf-8') as f:
-                    for file_info in file_data:
+                    for file_info in file_infos:
                         f.write(f"{file_info['absolute_path']}\n")
             
-            elif format.lower() == 'csv':
+            elif format == 'csv':
                 import csv
                 with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                    if file_data:
-                        writer = csv.DictWriter(f, fieldnames=file_data[0].keys())
+                    first = next(file_infos, None)
+                    if first is not None:
+                        writer = csv.DictWriter(f, fieldnames=first.keys())
                         writer.writeheader()
-                        writer.writerows(file_data)
-            
-            else:
-                self.logger.error(f"Unsupported export format: {format}")
-                return False
+                        writer.writerow(first)
+                        writer.writerows(file_infos)
             
             self.logger.info(f"File list exported to {output_path}")
             return True
@@ -417,9 +597,22 @@ class FileManager:
             self.logger.error(f"Error exporting file list: {e}")
             return False
     
+    def _write_json_list(self, f, items):
+        """Stream items as a JSON array, formatted like json.dump(indent=2)"""
+        first = True
+        for item in items:
+            f.write('[\n  ' if first else ',\n  ')
+            text = json.dumps(item, indent=2, ensure_ascii=False, default=str)
+            f.write(text.replace('\n', '\n  '))
+            first = False
+        f.write('[]' if first else '\n]')
+    
     def validate_file_integrity(self, file_path: Union[str, Path]) -> bool:
         """Basic file integrity check"""
         try:
+            if hasattr(os, 'pread'):
+                return self._validate_file_unbuffered(file_path)
+            
             file_path = Path(file_path)
             
             if not file_path.exists():
@@ -439,24 +632,36 @@ class FileManager:
             self.logger.warning(f"File integrity check failed for {file_path}: {e}")
             return False
     
+    def _validate_file_unbuffered(self, file_path: Union[str, Path]) -> bool:
+        """Read the first and last bytes with pread on a raw descriptor"""
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+        except FileNotFoundError:
+            return False
+        
+        try:
+            size = os.fstat(fd).st_size
+            os.pread(fd, 1, 0)
+            if size > 1:
+                os.pread(fd, 1, size - 1)
+        finally:
+            os.close(fd)
+        
+        return True
+    
     def get_directory_size(self, directory: Union[str, Path]) -> int:
         """Get total size of directory"""
-        try:
-            directory = Path(directory)
-            total_size = 0
-            
-            for item in directory.rglob('*'):
-                if item.is_file():
-                    try:
-                        total_size += item.stat().st_size
-                    except (OSError, PermissionError):
-                        continue
-            
-            return total_size
-            
-        except Exception as e:
-            self.logger.error(f"Error calculating directory size: {e}")
-            return 0
+        total_size = 0
+        
+        # One stat per file; unreadable directories are skipped by the walk.
+        # Symlinked files count their target's size, as Path.stat() did
+        for entry in self._scandir_recursive(directory):
+            try:
+                total_size += entry.stat().st_size
+            except OSError:
+                continue
+        
+        return total_size
     
     def cleanup_temp_files(self, temp_dir: Union[str, Path] = None) -> int:
         """Clean up temporary files"""
@@ -469,17 +674,19 @@ class FileManager:
             if not temp_dir.exists():
                 return 0
             
+            # DirEntry already knows each entry's type, so removing it is the
+            # only syscall per entry; symlinks are unlinked, never followed
             cleaned_count = 0
-            for item in temp_dir.iterdir():
-                try:
-                    if item.is_file():
-                        item.unlink()
-                        cleaned_count += 1
-                    elif item.is_dir():
-                        shutil.rmtree(str(item))
+            with os.scandir(temp_dir) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            shutil.rmtree(entry.path)
+                        else:
+                            os.unlink(entry.path)
                         cleaned_count += 1
-                except (OSError, PermissionError):
-                    continue
+                    except (OSError, PermissionError):
+                        continue
             
             self.logger.info(f"Cleaned up {cleaned_count} temporary files")
             return cleaned_count
@@ -4,9 +4,17 @@ Helper utilities and common functions for the video player
 
 import os
 import sys
+import stat
 import time
+import random
 import threading
+import heapq
+import logging
+import traceback
 import functools
+import platform
+from operator import itemgetter
+from collections import deque
 from pathlib import Path
 from typing import Any, Callable, Optional, Union
 import tkinter as tk
@@ -14,6 +22,11 @@ from tkinter import messagebox
 
 from utils.logger import Logger
 
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
 def setup_exception_handler():
     """Setup global exception handler for unhandled exceptions"""
     logger = Logger.get_logger()
@@ -46,31 +59,88 @@ def setup_exception_handler():
 
 def safe_call(func: Callable, *args, default=None, **kwargs) -> Any:
     """Safely call a function and return default value on error"""
-    logger = Logger.get_logger()
-    
     try:
         return func(*args, **kwargs)
     except Exception as e:
+        # Only failures need the logger, so successful calls skip the lookup
+        logger = Logger.get_logger()
         logger.warning(f"Safe call failed for {func.__name__}: {e}")
         return default
 
-def retry_on_failure(max_attempts: int = 3, delay: float = 1.0, exceptions: tuple = (Exception,)):
-    """Decorator to retry function on failure"""
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a function whose retry circuit is open"""
+
+def retry_on_failure(max_attempts: int = 3, delay: float = 1.0, exceptions: tuple = (Exception,),
+                     backoff: float = 2.0, jitter: float = 0.5, max_delay: float = 30.0,
+                     failure_threshold: int = 0, reset_timeout: float = 60.0):
+    """Decorator to retry function on failure
+    
+    Waits grow exponentially from delay by the backoff factor, capped at
+    max_delay, and are stretched by up to jitter (as a fraction) at random.
+    
+    The circuit breaker is off unless failure_threshold is given. With it
+    set, after failure_threshold consecutive calls exhaust their retries
+    the circuit opens: calls raise CircuitOpenError, without calling the
+    function, for reset_timeout seconds, then a single probe call is let
+    through to close it again.
+    """
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            logger = Logger.get_logger()
-            
+        state = {'failures': 0, 'open_until': None, 'probing': False}
+        lock = threading.Lock()
+        
+        def enter_circuit() -> bool:
+            """Raise if the circuit is open; True if this call is the probe"""
+            with lock:
+                if state['open_until'] is None:
+                    return False
+                if time.monotonic() < state['open_until'] or state['probing']:
+                    raise CircuitOpenError(f"Circuit open for {func.__name__}, not retrying")
+                # Half-open: let exactly one probe call through
+                state['probing'] = True
+                return True
+        
+        def record_result(succeeded: bool):
+            with lock:
+                if succeeded:
+                    state['failures'] = 0
+                    state['open_until'] = None
+                else:
+                    state['failures'] += 1
+                    if state['probing'] or state['failures'] >= failure_threshold:
+                        state['open_until'] = time.monotonic() + reset_timeout
+                state['probing'] = False
+        
+        def call_with_retries(*args, **kwargs):
             for attempt in range(max_attempts):
                 try:
-                    return func(*args, **kwargs)
+                    result = func(*args, **kwargs)
                 except exceptions as e:
+                    # Only failures need the logger, so successful calls skip the lookup
+                    logger = Logger.get_logger()
                     if attempt == max_attempts - 1:
                         logger.error(f"Function {func.__name__} failed after {max_attempts} attempts: {e}")
+                        if failure_threshold:
+                            record_result(False)
                         raise
                     else:
-                        logger.warning(f"Function {func.__name__} attempt {attempt + 1} failed: {e}, retrying in {delay}s")
-                        time.sleep(delay)
+                        wait = min(max_delay, delay * (backoff ** attempt)) * (1 + random.uniform(0, jitter))
+                        logger.warning(f"Function {func.__name__} attempt {attempt + 1} failed: {e}, retrying in {wait:.2f}s")
+                        time.sleep(wait)
+                else:
+                    if failure_threshold and (state['failures'] or state['open_until'] is not None):
+                        record_result(True)
+                    return result
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            probe = enter_circuit() if failure_threshold else False
+            try:
+                return call_with_retries(*args, **kwargs)
+            finally:
+                # A probe ended by an exception outside `exceptions` frees the slot
+                if probe and state['probing']:
+                    with lock:
+                        state['probing'] = False
             
         return wrapper
     return decorator
@@ -78,22 +148,28 @@ def retry_on_failure(max_attempts: int = 3, delay: float = 1.0, exceptions: tupl
 def debounce(wait_time: float):
     """Decorator to debounce function calls"""
     def decorator(func: Callable) -> Callable:
+        timer = None
+        lock = threading.Lock()
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            if not hasattr(wrapper, '_timer'):
-                wrapper._timer = None
+            nonlocal timer
             
             def call_function():
-                wrapper._timer = None
+                nonlocal timer
+                with lock:
+                    if timer is current:
+                        timer = None
                 return func(*args, **kwargs)
             
-            # Cancel previous timer
-            if wrapper._timer is not None:
-                wrapper._timer.cancel()
-            
-            # Start new timer
-            wrapper._timer = threading.Timer(wait_time, call_function)
-            wrapper._timer.start()
+            with lock:
+                # Cancel previous timer
+                if timer is not None:
+                    timer.cancel()
+                
+                # Start new timer
+                timer = current = threading.Timer(wait_time, call_function)
+                current.start()
             
         return wrapper
     return decorator
@@ -101,14 +177,15 @@ def debounce(wait_time: float):
 def throttle(min_interval: float):
     """Decorator to throttle function calls"""
     def decorator(func: Callable) -> Callable:
+        last_called = float('-inf')
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            if not hasattr(wrapper, '_last_called'):
-                wrapper._last_called = 0
+            nonlocal last_called
             
-            now = time.time()
-            if now - wrapper._last_called >= min_interval:
-                wrapper._last_called = now
+            now = time.monotonic()
+            if now - last_called >= min_interval:
+                last_called = now
                 return func(*args, **kwargs)
             
         return wrapper
@@ -131,37 +208,48 @@ def ensure_main_thread(func: Callable) -> Callable:
                 
     return wrapper
 
+# Last (whole seconds, text) pair returned by format_time; UI refreshes
+# several times per second mostly ask for the same second again
+_last_formatted_time = (None, "")
+
 def format_time(seconds: float) -> str:
     """Format time in HH:MM:SS or MM:SS format"""
+    global _last_formatted_time
+    
     if seconds < 0:
         return "00:00"
     
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    seconds = int(seconds % 60)
+    whole_seconds = int(seconds)
+    cached_seconds, cached_text = _last_formatted_time
+    if whole_seconds == cached_seconds:
+        return cached_text
+    
+    hours, remainder = divmod(whole_seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
     
     if hours > 0:
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        text = f"{hours:02d}:{minutes:02d}:{secs:02d}"
     else:
-        return f"{minutes:02d}:{seconds:02d}"
+        text = f"{minutes:02d}:{secs:02d}"
+    
+    _last_formatted_time = (whole_seconds, text)
+    return text
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
 
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human readable format"""
     if size_bytes < 0:
         return "0 B"
     
-    units = ['B', 'KB', 'MB', 'GB', 'TB']
-    unit_index = 0
-    size = float(size_bytes)
-    
-    while size >= 1024 and unit_index < len(units) - 1:
-        size /= 1024
-        unit_index += 1
+    # Each unit spans 10 bits, so bit_length picks the unit directly
+    size_bytes = int(size_bytes)
+    unit_index = 0 if size_bytes < 1024 else min(len(_SIZE_UNITS) - 1, (size_bytes.bit_length() - 1) // 10)
     
     if unit_index == 0:
-        return f"{int(size)} {units[unit_index]}"
+        return f"{size_bytes} {_SIZE_UNITS[0]}"
     else:
-        return f"{size:.1f} {units[unit_index]}"
+        return f"{size_bytes / (1 << (unit_index * 10)):.1f} {_SIZE_UNITS[unit_index]}"
 
 def clamp(value: Union[int, float], min_val: Union[int, float], max_val: Union[int, float]) -> Union[int, float]:
     """Clamp value between min and max"""
@@ -169,41 +257,63 @@ def clamp(value: Union[int, float], min_val: Union[int, float], max_val: Union[i
 
 def lerp(start: float, end: float, t: float) -> float:
     """Linear interpolation between start and end"""
-    return start + (end - start) * clamp(t, 0.0, 1.0)
+    # Clamp inline; these run many times per animation frame
+    t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
+    return start + (end - start) * t
 
 def ease_in_out(t: float) -> float:
     """Ease in-out animation curve"""
-    t = clamp(t, 0.0, 1.0)
+    t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
+    return t * t * (3.0 - 2.0 * t)
+
+def lerp_array(start: float, end: float, t):
+    """Linear interpolation for a whole array of t values at once"""
+    import numpy as np
+    t = np.clip(t, 0.0, 1.0)
+    return start + (end - start) * t
+
+def ease_in_out_array(t):
+    """Ease in-out animation curve for a whole array of t values at once"""
+    import numpy as np
+    t = np.clip(t, 0.0, 1.0)
     return t * t * (3.0 - 2.0 * t)
 
 def validate_path(path: Union[str, Path], must_exist: bool = True, must_be_file: bool = False, must_be_dir: bool = False) -> bool:
     """Validate file/directory path"""
     try:
-        path = Path(path)
+        # One stat() answers existence and type together
+        try:
+            st = os.stat(os.fspath(path))
+        except (FileNotFoundError, NotADirectoryError):
+            st = None
         
-        if must_exist and not path.exists():
-            return False
+        if st is None:
+            return not must_exist
         
-        if path.exists():
-            if must_be_file and not path.is_file():
-                return False
-            if must_be_dir and not path.is_dir():
-                return False
+        if must_be_file and not stat.S_ISREG(st.st_mode):
+            return False
+        if must_be_dir and not stat.S_ISDIR(st.st_mode):
+            return False
         
         return True
         
     except Exception:
         return False
 
-def get_unique_name(base_name: str, existing_names: list) -> str:
-    """Get unique name by adding number suffix"""
-    if base_name not in existing_names:
+def get_unique_name(base_name: str, existing_names: Union[list, set, frozenset]) -> str:
+    """Get unique name by adding number suffix
+    
+    Callers uniquing many names can pass a set to skip the conversion.
+    """
+    existing = existing_names if isinstance(existing_names, (set, frozenset)) else set(existing_names)
+    
+    if base_name not in existing:
         return base_name
     
     counter = 1
     while True:
         unique_name = f"{base_name} ({counter})"
-        if unique_name not in existing_names:
+        if unique_name not in existing:
             return unique_name
         counter += 1
         
@@ -212,72 +322,115 @@ def get_unique_name(base_name: str, existing_names: list) -> str:
             import uuid
             return f"{base_name} ({uuid.uuid4().hex[:8]})"
 
-def is_process_running(process_name: str) -> bool:
-    """Check if a process with given name is running"""
-    try:
-        import psutil
-        
+# Lower-cased names of running processes, reused for _PROCESS_CACHE_TTL seconds
+_PROCESS_CACHE_TTL = 1.0
+_process_cache = {'time': float('-inf'), 'names': frozenset()}
+
+def _list_process_names() -> frozenset:
+    """Collect lower-cased names of all running processes"""
+    if psutil is not None:
+        names = set()
         for proc in psutil.process_iter(['name']):
             try:
-                if proc.info['name'] and process_name.lower() in proc.info['name'].lower():
-                    return True
+                if proc.info['name']:
+                    names.add(proc.info['name'].lower())
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 continue
-        
-        return False
-        
-    except ImportError:
-        # psutil not available, use platform-specific methods
-        if sys.platform == "win32":
-            import subprocess
-            try:
-                output = subprocess.check_output(['tasklist'], shell=True, text=True)
-                return process_name.lower() in output.lower()
-            except subprocess.CalledProcessError:
-                return False
-        else:
-            import subprocess
+        return frozenset(names)
+    
+    if sys.platform.startswith('linux'):
+        # One small read per process instead of spawning ps
+        names = set()
+        for pid in os.listdir('/proc'):
+            if not pid.isdigit():
+                continue
             try:
-                output = subprocess.check_output(['ps', 'aux'], text=True)
-                return process_name.lower() in output.lower()
-            except subprocess.CalledProcessError:
-                return False
+                with open(f'/proc/{pid}/comm') as f:
+                    names.add(f.read().strip().lower())
+            except OSError:
+                continue
+        return frozenset(names)
+    
+    # psutil not available, use platform-specific methods
+    import subprocess
+    command = ['tasklist', '/fo', 'csv', '/nh'] if sys.platform == "win32" else ['ps', '-A', '-o', 'comm=']
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode != 0:
+        return frozenset()
+    
+    if sys.platform == "win32":
+        return frozenset(line.split('","')[0].strip('"').lower() for line in result.stdout.splitlines() if line)
+    return frozenset(os.path.basename(line.strip()).lower() for line in result.stdout.splitlines() if line.strip())
 
-def get_system_info() -> dict:
-    """Get system information"""
+def is_process_running(process_name: str) -> bool:
+    """Check if a process with given name is running"""
+    now = time.monotonic()
+    if now - _process_cache['time'] >= _PROCESS_CACHE_TTL:
+        try:
+            _process_cache['names'] = _list_process_names()
+        except Exception:
+            _process_cache['names'] = frozenset()
+        _process_cache['time'] = now
+    
+    process_name = process_name.lower()
+    names = _process_cache['names']
+    return process_name in names or any(process_name in name for name in names)
+
+@functools.lru_cache(maxsize=1)
+def _static_system_info() -> dict:
+    """System information that stays fixed for the process lifetime"""
     info = {
         'platform': sys.platform,
         'python_version': sys.version,
         'executable': sys.executable,
-        'cwd': os.getcwd(),
-        'pid': os.getpid()
+        'pid': os.getpid(),
+        'system': platform.system(),
+        'release': platform.release(),
+        'version': platform.version(),
+        'machine': platform.machine(),
+        'processor': platform.processor()
     }
     
-    try:
-        import platform
-        info.update({
-            'system': platform.system(),
-            'release': platform.release(),
-            'version': platform.version(),
-            'machine': platform.machine(),
-            'processor': platform.processor()
-        })
-    except ImportError:
-        pass
-    
-    try:
-        import psutil
+    if psutil is not None:
         info.update({
             'cpu_count': psutil.cpu_count(),
             'memory_total': psutil.virtual_memory().total,
-            'memory_available': psutil.virtual_memory().available,
             'disk_usage': psutil.disk_usage('/').total if sys.platform != 'win32' else psutil.disk_usage('C:').total
         })
-    except ImportError:
-        pass
     
     return info
 
+def get_system_info() -> dict:
+    """Get system information"""
+    info = dict(_static_system_info())
+    info['cwd'] = os.getcwd()
+    
+    if psutil is not None:
+        info['memory_available'] = psutil.virtual_memory().available
+    
+    return info
+
+# ioctl request that makes one file share another's extents (linux/fs.h)
+_FICLONE = 0x40049409
+
+def _clone_file(source: Path, destination: Path) -> bool:
+    """Clone source into destination without copying data; False if unsupported
+    
+    Works on copy-on-write filesystems (btrfs, XFS with reflink, ...).
+    """
+    if not sys.platform.startswith('linux'):
+        return False
+    
+    import fcntl
+    with open(source, 'rb') as src, open(destination, 'wb') as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        except OSError:
+            # EXDEV, EOPNOTSUPP, EINVAL, ...: fall back to a regular copy
+            return False
+    
+    return True
+
 def create_backup(file_path: Union[str, Path], backup_dir: Optional[Union[str, Path]] = None) -> Optional[Path]:
     """Create backup of a file"""
     try:
@@ -298,9 +451,12 @@ def create_backup(file_path: Union[str, Path], backup_dir: Optional[Union[str, P
         backup_name = f"{file_path.stem}_{timestamp}{file_path.suffix}"
         backup_path = backup_dir / backup_name
         
-        # Copy file
+        # Copy file, as a copy-on-write clone where the filesystem allows it
         import shutil
-        shutil.copy2(str(file_path), str(backup_path))
+        if _clone_file(file_path, backup_path):
+            shutil.copystat(str(file_path), str(backup_path))
+        else:
+            shutil.copy2(str(file_path), str(backup_path))
         
         return backup_path
         
@@ -317,19 +473,18 @@ def cleanup_backups(backup_dir: Union[str, Path], max_backups: int = 10):
         if not backup_dir.exists():
             return
         
-        # Get all backup files
-        backup_files = []
-        for file_path in backup_dir.iterdir():
-            if file_path.is_file():
-                backup_files.append((file_path, file_path.stat().st_mtime))
+        # Get all backup files; DirEntry reuses the type from the directory read
+        with os.scandir(backup_dir) as it:
+            backup_files = [(entry.path, entry.stat().st_mtime) for entry in it if entry.is_file()]
         
-        # Sort by modification time (newest first)
-        backup_files.sort(key=lambda x: x[1], reverse=True)
+        excess = len(backup_files) - max_backups
+        if excess <= 0:
+            return
         
-        # Remove old backups
-        for file_path, _ in backup_files[max_backups:]:
+        # Remove old backups, picking only the oldest instead of sorting all
+        for file_path, _ in heapq.nsmallest(excess, backup_files, key=itemgetter(1)):
             try:
-                file_path.unlink()
+                os.unlink(file_path)
             except Exception as e:
                 logger = Logger.get_logger()
                 logger.warning(f"Could not delete backup file {file_path}: {e}")
@@ -338,73 +493,64 @@ def cleanup_backups(backup_dir: Union[str, Path], max_backups: int = 10):
         logger = Logger.get_logger()
         logger.error(f"Error cleaning up backups: {e}")
 
+# psutil handle for this process, created on first use
+_self_process = None
+
 def monitor_memory_usage(threshold_mb: int = 500):
     """Monitor memory usage and log warnings if threshold is exceeded"""
-    try:
-        import psutil
-        
-        process = psutil.Process()
-        memory_mb = process.memory_info().rss / 1024 / 1024
-        
-        if memory_mb > threshold_mb:
-            logger = Logger.get_logger()
-            logger.warning(f"High memory usage detected: {memory_mb:.1f} MB")
-        
-        return memory_mb
-        
-    except ImportError:
+    global _self_process
+    
+    if psutil is None:
         return 0
+    
+    if _self_process is None:
+        _self_process = psutil.Process()
+    
+    memory_mb = _self_process.memory_info().rss / (1 << 20)
+    
+    if memory_mb > threshold_mb:
+        logger = Logger.get_logger()
+        logger.warning(f"High memory usage detected: {memory_mb:.1f} MB")
+    
+    return memory_mb
 
 def create_thread_safe_dict():
     """Create a thread-safe dictionary"""
-    class ThreadSafeDict:
-        def __init__(self):
-            self._dict = {}
-            self._lock = threading.RLock()
-        
-        def __getitem__(self, key):
-            with self._lock:
-                return self._dict[key]
+    class ThreadSafeDict(dict):
+        """dict whose single operations need no extra lock
         
-        def __setitem__(self, key, value):
-            with self._lock:
-                self._dict[key] = value
+        Individual dict operations are atomic under the GIL (and internally
+        locked on free-threaded builds), so only compound read-modify-write
+        helpers take the lock.
+        """
         
-        def __delitem__(self, key):
-            with self._lock:
-                del self._dict[key]
-        
-        def __contains__(self, key):
-            with self._lock:
-                return key in self._dict
-        
-        def get(self, key, default=None):
-            with self._lock:
-                return self._dict.get(key, default)
+        def __init__(self):
+            super().__init__()
+            self._lock = threading.RLock()
         
         def pop(self, key, default=None):
-            with self._lock:
-                return self._dict.pop(key, default)
+            return super().pop(key, default)
         
         def keys(self):
-            with self._lock:
-                return list(self._dict.keys())
+            return list(super().keys())
         
         def values(self):
-            with self._lock:
-                return list(self._dict.values())
+            return list(super().values())
         
         def items(self):
-            with self._lock:
-                return list(self._dict.items())
-        
-        def clear(self):
-            with self._lock:
-                self._dict.clear()
+            return list(super().items())
         
-        def update(self, other):
+        def get_or_create(self, key, factory: Callable):
+            """Get value for key, creating it with factory() if missing"""
+            try:
+                return self[key]
+            except KeyError:
+                pass
+            
             with self._lock:
-                self._dict.update(other)
+                if key not in self:
+                    self[key] = factory()
+                return self[key]
     
     return ThreadSafeDict()
 
@@ -414,25 +560,31 @@ class PerformanceTimer:
     def __init__(self, name: str = "Operation", log_result: bool = True):
         self.name = name
         self.log_result = log_result
-        self.start_time = None
-        self.end_time = None
-        self.duration = None
+        self.start_ns = None
+        self.end_ns = None
+        self.duration_ns = None
         self.logger = Logger.get_logger()
     
     def __enter__(self):
-        self.start_time = time.perf_counter()
+        self.start_ns = time.perf_counter_ns()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.end_time = time.perf_counter()
-        self.duration = self.end_time - self.start_time
+        self.end_ns = time.perf_counter_ns()
+        self.duration_ns = self.end_ns - self.start_ns
         
-        if self.log_result:
-            self.logger.debug(f"{self.name} completed in {self.duration:.4f} seconds")
+        # Skip building the message entirely when debug output is off
+        if self.log_result and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("%s completed in %.4f seconds", self.name, self.duration_ns / 1e9)
+    
+    @property
+    def duration(self) -> Optional[float]:
+        """Duration in seconds, or None before the block has exited"""
+        return None if self.duration_ns is None else self.duration_ns / 1e9
     
     def get_duration(self) -> float:
         """Get duration in seconds"""
-        return self.duration or 0.0
+        return (self.duration_ns or 0) / 1e9
 
 class RateLimiter:
     """Rate limiter to control function call frequency"""
@@ -440,16 +592,18 @@ class RateLimiter:
     def __init__(self, max_calls: int, time_window: float):
         self.max_calls = max_calls
         self.time_window = time_window
-        self.calls = []
+        self.calls = deque(maxlen=max_calls)
         self.lock = threading.Lock()
     
     def allow_call(self) -> bool:
         """Check if call is allowed within rate limit"""
         with self.lock:
-            now = time.time()
+            now = time.monotonic()
             
-            # Remove old calls outside the time window
-            self.calls = [call_time for call_time in self.calls if now - call_time < self.time_window]
+            # Remove old calls outside the time window (oldest are first)
+            calls = self.calls
+            while calls and now - calls[0] >= self.time_window:
+                calls.popleft()
             
             # Check if we can make another call
             if len(self.calls) < self.max_calls:
@@ -464,36 +618,87 @@ class RateLimiter:
             if len(self.calls) < self.max_calls:
                 return 0.0
             
-            oldest_call = min(self.calls)
-            return max(0.0, self.time_window - (time.time() - oldest_call))
+            oldest_call = self.calls[0]
+            return max(0.0, self.time_window - (time.monotonic() - oldest_call))
 
 def extract_error_info(exception: Exception) -> dict:
     """Extract detailed information from an exception"""
-    import traceback
+    # Format the passed exception's own traceback, not whatever is current
+    tb = exception.__traceback__
     
     return {
         'type': exception.__class__.__name__,
         'message': str(exception),
         'module': exception.__class__.__module__,
-        'traceback': traceback.format_exc(),
+        'traceback': ''.join(traceback.format_exception(type(exception), exception, tb)) if tb else '',
         'args': exception.args if hasattr(exception, 'args') else []
     }
 
-def schedule_periodic_task(func: Callable, interval: float, run_immediately: bool = False) -> threading.Timer:
-    """Schedule a function to run periodically"""
-    def run_periodic():
+class PeriodicTask:
+    """Handle for a task started by schedule_periodic_task
+    
+    Runs on one persistent daemon thread, or on the Tk main loop via
+    after() when a root is given; cancel() stops either.
+    """
+    
+    def __init__(self, func: Callable, interval: float, root: Optional[tk.Misc] = None):
+        self.func = func
+        self.interval = interval
+        self.root = root
+        self._stop = threading.Event()
+        self._after_id = None
+        self._thread = None
+        self.logger = Logger.get_logger()
+    
+    def start(self):
+        """Start periodic execution, first run after one interval"""
+        if self.root is not None:
+            self._after_id = self.root.after(int(self.interval * 1000), self._run_tk)
+        else:
+            self._thread = threading.Thread(target=self._run_thread, daemon=True)
+            self._thread.start()
+    
+    def cancel(self):
+        """Stop periodic execution"""
+        self._stop.set()
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+    
+    def is_alive(self) -> bool:
+        """Check if the task is still scheduled"""
+        return not self._stop.is_set()
+    
+    def _run_once(self):
         try:
-            func()
+            self.func()
         except Exception as e:
-            logger = Logger.get_logger()
-            logger.error(f"Error in periodic task {func.__name__}: {e}")
-        finally:
-            # Schedule next run
-            timer = threading.Timer(interval, run_periodic)
-            timer.daemon = True
-            timer.start()
-            return timer
+            self.logger.error(f"Error in periodic task {self.func.__name__}: {e}")
+    
+    def _run_thread(self):
+        # Event.wait doubles as a sleep that cancel() can interrupt
+        while not self._stop.wait(self.interval):
+            self._run_once()
+    
+    def _run_tk(self):
+        self._after_id = None
+        if self._stop.is_set():
+            return
+        
+        self._run_once()
+        if not self._stop.is_set():
+            self._after_id = self.root.after(int(self.interval * 1000), self._run_tk)
+
+def schedule_periodic_task(func: Callable, interval: float, run_immediately: bool = False,
+                           root: Optional[tk.Misc] = None) -> PeriodicTask:
+    """Schedule a function to run periodically
     
+    Pass a Tk root to run func on the main thread through after() instead
+    of on a background thread.
+    """
     if run_immediately:
         # Run once immediately, then start periodic execution
         try:
@@ -503,7 +708,6 @@ def schedule_periodic_task(func: Callable, interval: float, run_immediately: boo
             logger.error(f"Error in immediate execution of {func.__name__}: {e}")
     
     # Start periodic execution
-    timer = threading.Timer(interval, run_periodic)
-    timer.daemon = True
-    timer.start()
-    return timer
+    task = PeriodicTask(func, interval, root)
+    task.start()
+    return task
@@ -2,46 +2,185 @@
 Keyboard shortcut handling for the video player
 """
 
+import re
+import sys
+import json
+import string
+import logging
+import functools
 import tkinter as tk
+from collections import defaultdict
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Dict, Callable, Optional
+from pathlib import Path
 from utils.logger import Logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# event.state bits for each modifier (Alt is Mod1 on X11, its own bit elsewhere)
+_MODIFIER_MASKS = {
+    'ctrl': 0x0004,
+    'shift': 0x0001,
+    'alt': 0x20000 if sys.platform == 'win32' else 0x0010 if sys.platform == 'darwin' else 0x0008,
+}
+
+# Modifier keys themselves; event.state on their press lacks their own bit
+_MODIFIER_KEYSYMS = {
+    'Control_L': _MODIFIER_MASKS['ctrl'],
+    'Control_R': _MODIFIER_MASKS['ctrl'],
+    'Shift_L': _MODIFIER_MASKS['shift'],
+    'Shift_R': _MODIFIER_MASKS['shift'],
+    'Alt_L': _MODIFIER_MASKS['alt'],
+    'Alt_R': _MODIFIER_MASKS['alt'],
+}
+
+# Keyboard settings saved alongside exported bindings
+_KEYBOARD_SETTINGS = ('space_play_pause', 'arrow_seek', 'f_fullscreen', 'esc_exit_fullscreen', 'volume_keys')
+
+# Plain or Control- letter sequences, which are bound case-insensitively
+_LETTER_SEQUENCE = re.compile(r'<(Control-)?(?:KeyPress-|Key-)?([A-Za-z])>')
+
+def _letter_key(key_sequence: str) -> Optional[tuple]:
+    """(lower-case letter, control) for a letter shortcut, else None"""
+    match = _LETTER_SEQUENCE.fullmatch(key_sequence)
+    if match is None:
+        return None
+    return match.group(2).lower(), match.group(1) is not None
+
+# Display names for special keys in shortcut descriptions
+_SPECIAL_KEYS = MappingProxyType({
+    'space': 'Space',
+    'return': 'Enter',
+    'escape': 'Esc',
+    'tab': 'Tab',
+    'backspace': 'Backspace',
+    'delete': 'Delete',
+    'up': '↑',
+    'down': '↓',
+    'left': '←',
+    'right': '→',
+    'plus': '+',
+    'minus': '-',
+    'equal': '='
+})
+
+# Key mapping for special keys
+_KEY_MAPPING = MappingProxyType({
+    'space': ' ',
+    'return': '\r',
+    'enter': '\r',
+    'escape': '\x1b',
+    'tab': '\t',
+    'backspace': '\x08',
+    'delete': '\x7f',
+    'up': 'Up',
+    'down': 'Down',
+    'left': 'Left',
+    'right': 'Right',
+    'f1': 'F1', 'f2': 'F2', 'f3': 'F3', 'f4': 'F4',
+    'f5': 'F5', 'f6': 'F6', 'f7': 'F7', 'f8': 'F8',
+    'f9': 'F9', 'f10': 'F10', 'f11': 'F11', 'f12': 'F12'
+})
+
+# Names accepted by validate_key_sequence: modifiers, and main keys in both
+# the friendly and Tk spellings of _KEY_MAPPING
+_VALID_MODIFIERS = frozenset({'Control', 'Shift', 'Alt', 'Meta'})
+_VALID_KEYS = frozenset({
+    *string.ascii_letters, *string.digits, *(f'F{i}' for i in range(1, 13)),
+    *_KEY_MAPPING.keys(), *_KEY_MAPPING.values()
+})
+
+@functools.lru_cache(maxsize=64)
+def _pretty_action(action: str) -> str:
+    """Fallback description for actions without one, e.g. 'Toggle Playlist'"""
+    return action.replace('_', ' ').title()
+
+@functools.lru_cache(maxsize=256)
+def _describe_key_sequence(key_sequence: str) -> str:
+    """Convert a Tkinter key sequence to a readable format, e.g. Ctrl+O"""
+    key_parts = key_sequence.strip('<>').split('-')
+    
+    # Handle modifiers
+    modifiers = []
+    for part in key_parts[:-1]:
+        if part.lower() == 'control':
+            modifiers.append('Ctrl')
+        elif part.lower() == 'shift':
+            modifiers.append('Shift')
+        elif part.lower() == 'alt':
+            modifiers.append('Alt')
+        else:
+            modifiers.append(part.title())
+    
+    # Convert special keys
+    main_key = key_parts[-1]
+    main_key = _SPECIAL_KEYS.get(main_key.lower(), main_key.upper())
+    
+    # Combine modifiers and main key
+    if modifiers:
+        return '+'.join(modifiers) + '+' + main_key
+    else:
+        return main_key
+
 class KeyboardHandler:
     """Handles keyboard shortcuts and bindings"""
     
+    # Special key names, shared (read-only) by all handlers
+    key_mapping = _KEY_MAPPING
+    
+    # Shortcut help tables, see create_shortcuts_help
+    SHORTCUT_CATEGORIES = ('Playback', 'Navigation', 'Volume', 'View', 'File')
+    
+    ACTION_CATEGORIES = MappingProxyType({
+        'play_pause': 'Playback',
+        'stop': 'Playback',
+        'next': 'Navigation',
+        'previous': 'Navigation',
+        'seek_forward': 'Navigation',
+        'seek_backward': 'Navigation',
+        'volume_up': 'Volume',
+        'volume_down': 'Volume',
+        'mute': 'Volume',
+        'fullscreen': 'View',
+        'open_file': 'File',
+        'quit': 'File'
+    })
+    
+    ACTION_DESCRIPTIONS = MappingProxyType({
+        'play_pause': 'Play/Pause',
+        'stop': 'Stop',
+        'next': 'Next Video',
+        'previous': 'Previous Video',
+        'seek_forward': 'Seek Forward',
+        'seek_backward': 'Seek Backward',
+        'volume_up': 'Volume Up',
+        'volume_down': 'Volume Down',
+        'mute': 'Mute/Unmute',
+        'fullscreen': 'Toggle Fullscreen',
+        'open_file': 'Open File',
+        'quit': 'Quit Application'
+    })
+    
     def __init__(self, settings):
         """Initialize keyboard handler"""
         self.settings = settings
         self.logger = Logger.get_logger()
         
-        # Key bindings storage
+        # Key bindings storage; Tk holds the resolved handlers, bindings
+        # only mirrors key_sequence -> action for help and export
         self.bindings = {}
         self.callbacks = {}
         
-        # Modifier key state
-        self.modifiers = {
-            'ctrl': False,
-            'shift': False,
-            'alt': False
-        }
+        # Tk widget path -> {(lower-case letter, control): handler}, see _bind_letter
+        self._letter_handlers = {}
+        
+        # Modifier bits currently held, kept current by key press and release events
+        self._last_state = 0
         
-        # Key mapping for special keys
-        self.key_mapping = {
-            'space': ' ',
-            'return': '\r',
-            'enter': '\r',
-            'escape': '\x1b',
-            'tab': '\t',
-            'backspace': '\x08',
-            'delete': '\x7f',
-            'up': 'Up',
-            'down': 'Down',
-            'left': 'Left',
-            'right': 'Right',
-            'f1': 'F1', 'f2': 'F2', 'f3': 'F3', 'f4': 'F4',
-            'f5': 'F5', 'f6': 'F6', 'f7': 'F7', 'f8': 'F8',
-            'f9': 'F9', 'f10': 'F10', 'f11': 'F11', 'f12': 'F12'
-        }
         
         self.logger.info("Keyboard handler initialized")
     
@@ -57,8 +196,10 @@ class KeyboardHandler:
             self._setup_default_bindings(widget)
             
             # Set up global key event handlers
-            widget.bind('<KeyPress>', self._on_key_press)
-            widget.bind('<KeyRelease>', self._on_key_release)
+            self._bind_key_events(widget)
+            
+            # Key handlers don't catch their own errors; log them here instead
+            widget._root().report_callback_exception = self._report_callback_exception
             
             # Focus handling
             widget.focus_set()
@@ -71,44 +212,44 @@ class KeyboardHandler:
     def _setup_default_bindings(self, widget: tk.Widget):
         """Setup default keyboard bindings based on settings"""
         try:
+            getboolean = self.settings.getboolean
+            space_play_pause = getboolean('keyboard', 'space_play_pause', True)
+            arrow_seek = getboolean('keyboard', 'arrow_seek', True)
+            volume_keys = getboolean('keyboard', 'volume_keys', True)
+            f_fullscreen = getboolean('keyboard', 'f_fullscreen', True)
+            esc_exit_fullscreen = getboolean('keyboard', 'esc_exit_fullscreen', True)
+            
             # Play/Pause - Space
-            if self.settings.getboolean('keyboard', 'space_play_pause', True):
+            if space_play_pause:
                 self.add_binding(widget, '<space>', 'play_pause')
             
             # Seek controls - Arrow keys
-            if self.settings.getboolean('keyboard', 'arrow_seek', True):
+            if arrow_seek:
                 self.add_binding(widget, '<Left>', 'seek_backward')
                 self.add_binding(widget, '<Right>', 'seek_forward')
             
             # Volume controls - Up/Down arrows (if enabled)
-            if self.settings.getboolean('keyboard', 'volume_keys', True):
+            if volume_keys:
                 self.add_binding(widget, '<Up>', 'volume_up')
                 self.add_binding(widget, '<Down>', 'volume_down')
             
             # Fullscreen - F key
-            if self.settings.getboolean('keyboard', 'f_fullscreen', True):
+            if f_fullscreen:
                 self.add_binding(widget, '<f>', 'fullscreen')
-                self.add_binding(widget, '<F>', 'fullscreen')
             
             # Exit fullscreen - Escape
-            if self.settings.getboolean('keyboard', 'esc_exit_fullscreen', True):
+            if esc_exit_fullscreen:
                 self.add_binding(widget, '<Escape>', 'fullscreen')
             
-            # Media controls
+            # Media controls (letter keys match either case)
             self.add_binding(widget, '<s>', 'stop')
-            self.add_binding(widget, '<S>', 'stop')
             self.add_binding(widget, '<m>', 'mute')
-            self.add_binding(widget, '<M>', 'mute')
             self.add_binding(widget, '<n>', 'next')
-            self.add_binding(widget, '<N>', 'next')
             self.add_binding(widget, '<p>', 'previous')
-            self.add_binding(widget, '<P>', 'previous')
             
             # File operations
             self.add_binding(widget, '<Control-o>', 'open_file')
-            self.add_binding(widget, '<Control-O>', 'open_file')
             self.add_binding(widget, '<Control-q>', 'quit')
-            self.add_binding(widget, '<Control-Q>', 'quit')
             
             # Additional shortcuts
             self.add_binding(widget, '<F11>', 'fullscreen')
@@ -121,141 +262,126 @@ class KeyboardHandler:
     
     def add_binding(self, widget: tk.Widget, key_sequence: str, action: str):
         """Add a keyboard binding"""
-        try:
+        callback = self.callbacks.get(action)
+        if callable(callback):
+            # Point Tk straight at the callback; no lookup per keystroke
+            def handler(event, callback=callback):
+                callback()
+                return 'break'  # Prevent further event propagation
+        else:
             def handler(event):
-                return self._handle_key_action(action, event)
-            
+                self.logger.warning(f"No callback registered for action: {action}")
+        
+        letter_key = _letter_key(key_sequence)
+        if letter_key is not None:
+            key_sequence = self._bind_letter(widget, letter_key, handler)
+        else:
             widget.bind(key_sequence, handler)
-            self.bindings[key_sequence] = action
-            
-            self.logger.debug(f"Added binding: {key_sequence} -> {action}")
-            
-        except Exception as e:
-            self.logger.error(f"Error adding binding {key_sequence}: {e}")
+        self.bindings[key_sequence] = action
+        
+        self.logger.debug(f"Added binding: {key_sequence} -> {action}")
+    
+    def _bind_letter(self, widget: tk.Widget, letter_key: tuple, handler: Callable) -> str:
+        """Register a case-insensitive letter shortcut on widget; returns its key sequence
+        
+        Letter shortcuts are dispatched from _on_key_press instead of one Tk
+        binding per case, which halves the bindings Tk matches per event.
+        """
+        letter, control = letter_key
+        self._bind_key_events(widget)[letter_key] = handler
+        return f"<Control-{letter}>" if control else f"<{letter}>"
+    
+    def _bind_key_events(self, widget: tk.Widget) -> dict:
+        """Bind the key press/release handlers on widget once; returns its letter table"""
+        path = str(widget)
+        letter_handlers = self._letter_handlers.get(path)
+        if letter_handlers is None:
+            letter_handlers = self._letter_handlers[path] = {}
+            widget.bind('<KeyPress>', lambda event: self._on_key_press(event, letter_handlers))
+            widget.bind('<KeyRelease>', self._on_key_release)
+        return letter_handlers
     
     def remove_binding(self, widget: tk.Widget, key_sequence: str):
         """Remove a keyboard binding"""
-        try:
+        letter_key = _letter_key(key_sequence)
+        if letter_key is not None:
+            self._letter_handlers.get(str(widget), {}).pop(letter_key, None)
+            key_sequence = f"<Control-{letter_key[0]}>" if letter_key[1] else f"<{letter_key[0]}>"
+        else:
             widget.unbind(key_sequence)
-            if key_sequence in self.bindings:
-                del self.bindings[key_sequence]
-            
-            self.logger.debug(f"Removed binding: {key_sequence}")
-            
-        except Exception as e:
-            self.logger.error(f"Error removing binding {key_sequence}: {e}")
+        self.bindings.pop(key_sequence, None)
+        
+        self.logger.debug(f"Removed binding: {key_sequence}")
     
     def clear_bindings(self, widget: tk.Widget):
         """Clear all keyboard bindings"""
         try:
-            for key_sequence in list(self.bindings.keys()):
-                self.remove_binding(widget, key_sequence)
+            # Letter shortcuts live only in the widget's _letter_handlers table, not in Tk
+            key_sequences = tuple(self.bindings)
+            unbind = widget.unbind
+            for key_sequence in key_sequences:
+                if _letter_key(key_sequence) is None:
+                    unbind(key_sequence)
             
             self.bindings.clear()
-            self.logger.debug("Cleared all bindings")
+            
+            # Cleared in place; the widget's <KeyPress> handler keeps a reference
+            letter_handlers = self._letter_handlers.get(str(widget))
+            if letter_handlers:
+                letter_handlers.clear()
+            self.logger.debug("Cleared %d bindings", len(key_sequences))
             
         except Exception as e:
             self.logger.error(f"Error clearing bindings: {e}")
     
-    def _handle_key_action(self, action: str, event: tk.Event = None) -> str:
-        """Handle keyboard action"""
-        try:
-            if action in self.callbacks:
-                callback = self.callbacks[action]
-                if callable(callback):
-                    callback()
-                    return 'break'  # Prevent further event propagation
-            else:
-                self.logger.warning(f"No callback registered for action: {action}")
-            
-        except Exception as e:
-            self.logger.error(f"Error handling key action {action}: {e}")
+    def _on_key_press(self, event: tk.Event, letter_handlers: Optional[dict] = None):
+        """Handle key press events, dispatching the bound widget's letter shortcuts"""
+        # event.state holds the modifiers down before this press, so a
+        # modifier key being pressed adds its own bit
+        if isinstance(event.state, int):
+            self._last_state = event.state | _MODIFIER_KEYSYMS.get(event.keysym, 0)
         
-        return None
-    
-    def _on_key_press(self, event: tk.Event):
-        """Handle key press events"""
-        try:
-            # Update modifier state
-            if event.keysym in ['Control_L', 'Control_R']:
-                self.modifiers['ctrl'] = True
-            elif event.keysym in ['Shift_L', 'Shift_R']:
-                self.modifiers['shift'] = True
-            elif event.keysym in ['Alt_L', 'Alt_R']:
-                self.modifiers['alt'] = True
-            
-            # Log key press for debugging
+        # Log key press for debugging
+        if self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(f"Key pressed: {event.keysym} (char: {repr(event.char)})")
-            
-        except Exception as e:
-            self.logger.error(f"Error handling key press: {e}")
+        
+        # Letter shortcuts, either case; Control-letter falls back to the
+        # plain letter as Tk's own matching would
+        keysym = event.keysym
+        if len(keysym) == 1 and letter_handlers:
+            letter = keysym.lower()
+            handler = None
+            if event.state & _MODIFIER_MASKS['ctrl']:
+                handler = letter_handlers.get((letter, True))
+            if handler is None:
+                handler = letter_handlers.get((letter, False))
+            if handler is not None:
+                return handler(event)
     
     def _on_key_release(self, event: tk.Event):
-        """Handle key release events"""
-        try:
-            # Update modifier state
-            if event.keysym in ['Control_L', 'Control_R']:
-                self.modifiers['ctrl'] = False
-            elif event.keysym in ['Shift_L', 'Shift_R']:
-                self.modifiers['shift'] = False
-            elif event.keysym in ['Alt_L', 'Alt_R']:
-                self.modifiers['alt'] = False
-            
-        except Exception as e:
-            self.logger.error(f"Error handling key release: {e}")
+        """Track modifier state on key release"""
+        # event.state still includes the key being released
+        if isinstance(event.state, int):
+            self._last_state = event.state & ~_MODIFIER_KEYSYMS.get(event.keysym, 0)
     
-    def is_modifier_pressed(self, modifier: str) -> bool:
-        """Check if a modifier key is currently pressed"""
-        return self.modifiers.get(modifier.lower(), False)
+    def _report_callback_exception(self, exc_type, exc_value, exc_traceback):
+        """Log exceptions raised by Tk callbacks"""
+        self.logger.error(
+            f"Error in Tk callback: {exc_value}",
+            exc_info=(exc_type, exc_value, exc_traceback)
+        )
+    
+    def is_modifier_pressed(self, modifier: str, event: Optional[tk.Event] = None) -> bool:
+        """Check if a modifier key is pressed, as of event or the latest key event"""
+        state = self._last_state if event is None else event.state
+        if not isinstance(state, int):
+            return False  # Tk passes state as a string for some event types
+        return bool(state & _MODIFIER_MASKS.get(modifier.lower(), 0))
     
     def get_key_description(self, key_sequence: str) -> str:
         """Get human-readable description of a key sequence"""
         try:
-            # Convert Tkinter key sequence to readable format
-            key_desc = key_sequence.strip('<>')
-            
-            # Handle modifiers
-            modifiers = []
-            key_parts = key_desc.split('-')
-            
-            for i, part in enumerate(key_parts[:-1]):
-                if part.lower() == 'control':
-                    modifiers.append('Ctrl')
-                elif part.lower() == 'shift':
-                    modifiers.append('Shift')
-                elif part.lower() == 'alt':
-                    modifiers.append('Alt')
-                else:
-                    modifiers.append(part.title())
-            
-            # Get the main key
-            main_key = key_parts[-1]
-            
-            # Convert special keys
-            special_keys = {
-                'space': 'Space',
-                'return': 'Enter',
-                'escape': 'Esc',
-                'tab': 'Tab',
-                'backspace': 'Backspace',
-                'delete': 'Delete',
-                'up': '↑',
-                'down': '↓',
-                'left': '←',
-                'right': '→',
-                'plus': '+',
-                'minus': '-',
-                'equal': '='
-            }
-            
-            main_key = special_keys.get(main_key.lower(), main_key.upper())
-            
-            # Combine modifiers and main key
-            if modifiers:
-                return '+'.join(modifiers) + '+' + main_key
-            else:
-                return main_key
-                
+            return _describe_key_sequence(key_sequence)
         except Exception as e:
             self.logger.error(f"Error getting key description: {e}")
             return key_sequence
@@ -271,21 +397,17 @@ class KeyboardHandler:
     def export_bindings(self, file_path: str) -> bool:
         """Export current bindings to a file"""
         try:
-            import json
-            
+            getboolean = self.settings.getboolean
             export_data = {
                 'bindings': self.bindings,
-                'settings': {
-                    'space_play_pause': self.settings.getboolean('keyboard', 'space_play_pause', True),
-                    'arrow_seek': self.settings.getboolean('keyboard', 'arrow_seek', True),
-                    'f_fullscreen': self.settings.getboolean('keyboard', 'f_fullscreen', True),
-                    'esc_exit_fullscreen': self.settings.getboolean('keyboard', 'esc_exit_fullscreen', True),
-                    'volume_keys': self.settings.getboolean('keyboard', 'volume_keys', True)
-                }
+                'settings': {key: getboolean('keyboard', key, True) for key in _KEYBOARD_SETTINGS}
             }
             
-            with open(file_path, 'w') as f:
-                json.dump(export_data, f, indent=2)
+            # Serialize in one go and write once
+            if orjson is not None:
+                Path(file_path).write_bytes(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+            else:
+                Path(file_path).write_text(json.dumps(export_data, indent=2))
             
             self.logger.info(f"Bindings exported to {file_path}")
             return True
@@ -297,10 +419,9 @@ class KeyboardHandler:
     def import_bindings(self, file_path: str, widget: tk.Widget) -> bool:
         """Import bindings from a file"""
         try:
-            import json
-            
-            with open(file_path, 'r') as f:
-                import_data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            import_data = orjson.loads(data) if orjson is not None else json.loads(data)
             
             # Clear current bindings
             self.clear_bindings(widget)
@@ -312,8 +433,8 @@ class KeyboardHandler:
             
             # Update settings if provided
             settings = import_data.get('settings', {})
-            for setting_key, value in settings.items():
-                self.settings.set('keyboard', setting_key, str(value))
+            if settings:
+                self.settings.update('keyboard', settings)
             
             self.logger.info(f"Bindings imported from {file_path}")
             return True
@@ -325,64 +446,26 @@ class KeyboardHandler:
     def create_shortcuts_help(self) -> Dict[str, list]:
         """Create organized shortcuts help data"""
         try:
-            shortcuts = {
-                'Playback': [],
-                'Navigation': [],
-                'Volume': [],
-                'View': [],
-                'File': []
-            }
+            # Standard categories always appear, in this order
+            shortcuts = defaultdict(list, ((category, []) for category in self.SHORTCUT_CATEGORIES))
+            get_category = self.ACTION_CATEGORIES.get
+            get_description = self.ACTION_DESCRIPTIONS.get
             
             # Categorize shortcuts
-            action_categories = {
-                'play_pause': 'Playback',
-                'stop': 'Playback',
-                'next': 'Navigation',
-                'previous': 'Navigation',
-                'seek_forward': 'Navigation',
-                'seek_backward': 'Navigation',
-                'volume_up': 'Volume',
-                'volume_down': 'Volume',
-                'mute': 'Volume',
-                'fullscreen': 'View',
-                'open_file': 'File',
-                'quit': 'File'
-            }
-            
-            action_descriptions = {
-                'play_pause': 'Play/Pause',
-                'stop': 'Stop',
-                'next': 'Next Video',
-                'previous': 'Previous Video',
-                'seek_forward': 'Seek Forward',
-                'seek_backward': 'Seek Backward',
-                'volume_up': 'Volume Up',
-                'volume_down': 'Volume Down',
-                'mute': 'Mute/Unmute',
-                'fullscreen': 'Toggle Fullscreen',
-                'open_file': 'Open File',
-                'quit': 'Quit Application'
-            }
-            
             for key_sequence, action in self.bindings.items():
-                category = action_categories.get(action, 'Other')
-                description = action_descriptions.get(action, action.replace('_', ' ').title())
-                key_desc = self.get_key_description(key_sequence)
-                
-                if category not in shortcuts:
-                    shortcuts[category] = []
-                
-                shortcuts[category].append({
-                    'key': key_desc,
+                description = get_description(action) or _pretty_action(action)
+                shortcuts[get_category(action, 'Other')].append({
+                    'key': self.get_key_description(key_sequence),
                     'description': description,
                     'action': action
                 })
             
             # Sort each category
-            for category in shortcuts:
-                shortcuts[category].sort(key=lambda x: x['description'])
+            by_description = itemgetter('description')
+            for entries in shortcuts.values():
+                entries.sort(key=by_description)
             
-            return shortcuts
+            return dict(shortcuts)
             
         except Exception as e:
             self.logger.error(f"Error creating shortcuts help: {e}")
@@ -392,28 +475,20 @@ class KeyboardHandler:
         """Validate if a key sequence is valid"""
         try:
             # Basic validation for Tkinter key sequences
-            if not key_sequence.startswith('<') or not key_sequence.endswith('>'):
+            if key_sequence[:1] != '<' or key_sequence[-1:] != '>':
                 return False
             
             # Check for valid modifiers and key names
-            inner = key_sequence[1:-1]
-            parts = inner.split('-')
-            
-            valid_modifiers = {'Control', 'Shift', 'Alt', 'Meta'}
-            valid_keys = set(self.key_mapping.values()) | set(self.key_mapping.keys())
-            valid_keys.update(['F1', 'F2', 'F3', 'F4', 'F5', 'F6', 'F7', 'F8', 'F9', 'F10', 'F11', 'F12'])
-            valid_keys.update([chr(i) for i in range(ord('a'), ord('z') + 1)])
-            valid_keys.update([chr(i) for i in range(ord('A'), ord('Z') + 1)])
-            valid_keys.update([str(i) for i in range(10)])
+            parts = key_sequence[1:-1].split('-')
             
             # Check modifiers (all but last part)
             for modifier in parts[:-1]:
-                if modifier not in valid_modifiers:
+                if modifier not in _VALID_MODIFIERS:
                     return False
             
             # Check main key (last part)
             main_key = parts[-1]
-            if main_key not in valid_keys and len(main_key) != 1:
+            if main_key not in _VALID_KEYS and len(main_key) != 1:
                 return False
             
             return True
@@ -5,36 +5,198 @@ Logging utilities for the video player application
 import logging
 import logging.handlers
 import os
+import locale
+import re
+import copy
+import functools
+import shutil
 import sys
+import time
+import queue
+import atexit
 from pathlib import Path
 from datetime import datetime
 import threading
 
+# Severity order used when filtering exported log lines
+_LEVEL_HIERARCHY = {
+    'DEBUG': 0,
+    'INFO': 1,
+    'WARNING': 2,
+    'ERROR': 3,
+    'CRITICAL': 4
+}
+
+# Level names padded as %(levelname)-8s renders them
+_PADDED_LEVELS = {level: f'{level:<8}' for level in _LEVEL_HIERARCHY}
+
+# Level field as the detailed formatter pads it ("| INFO     |")
+_LEVEL_PATTERNS = {level: f'| {padded} |'.encode() for level, padded in _PADDED_LEVELS.items()}
+
+# Seconds a get_log_files() listing stays valid
+_LOG_FILES_TTL = 1.0
+
+# User-space buffer for the main log file
+_LOG_WRITE_BUFFER_SIZE = 64 * 1024
+
+# Size of the chunks export_logs hands to the output file
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+# Leading "timestamp | level" fields of a detailed-format log line
+_LINE_RE = re.compile(r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) \| (\w+)')
+
+# Log files named after the day they were started (video_player_YYYYMMDD.log)
+_DATED_LOG_RE = re.compile(r'(?:video_player|errors)_(\d{8})\.log$')
+
+def _date_key(value):
+    """Convert a datetime to a comparable integer tuple"""
+    if isinstance(value, datetime):
+        return (value.year, value.month, value.day,
+                value.hour, value.minute, value.second, value.microsecond)
+    return value
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the rendered timestamp for records within the same second"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._local = threading.local()
+    
+    def formatTime(self, record, datefmt=None):
+        """Render the timestamp once per second per thread"""
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        cache = getattr(self._local, 'cache', None)
+        if cache and cache[0] == second and cache[1] == datefmt:
+            return cache[2]
+        
+        rendered = time.strftime(datefmt, self.converter(second))
+        self._local.cache = (second, datefmt, rendered)
+        return rendered
+
+class LineFormatter(CachedTimeFormatter):
+    """Formatter for the application's fixed "time | level | ..." layouts"""
+    
+    DETAILED_FORMAT = '%(asctime)s | %(levelname)-8s | %(name)s:%(lineno)d | %(funcName)s() | %(message)s'
+    SIMPLE_FORMAT = '%(asctime)s | %(levelname)-8s | %(message)s'
+    
+    def __init__(self, detailed=True, datefmt=None):
+        super().__init__(fmt=self.DETAILED_FORMAT if detailed else self.SIMPLE_FORMAT, datefmt=datefmt)
+        self._detailed = detailed
+    
+    def usesTime(self):
+        """Both layouts start with the timestamp"""
+        return True
+    
+    def formatMessage(self, record):
+        """Assemble the line directly instead of %-substituting the template"""
+        level = _PADDED_LEVELS.get(record.levelname) or f'{record.levelname:<8}'
+        if self._detailed:
+            return ''.join((record.asctime, ' | ', level, ' | ', record.name, ':', str(record.lineno),
+                            ' | ', record.funcName, '() | ', record.message))
+        return ''.join((record.asctime, ' | ', level, ' | ', record.message))
+
+class FastRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that tracks the file size itself and buffers writes"""
+    
+    def __init__(self, filename, *args, **kwargs):
+        super().__init__(filename, *args, **kwargs)
+        try:
+            self._written_bytes = os.path.getsize(self.baseFilename)
+        except OSError:
+            self._written_bytes = 0
+        
+        # Codec used to size non-ASCII records in bytes, like the file on disk
+        encoding = self.encoding
+        if encoding in (None, 'locale'):
+            encoding = locale.getpreferredencoding(False)
+        self._size_encoding = encoding
+    
+    def _open(self):
+        """Open the log file with a large write buffer"""
+        return open(self.baseFilename, self.mode, buffering=_LOG_WRITE_BUFFER_SIZE,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def doRollover(self):
+        """Rotate files and restart the size counter"""
+        super().doRollover()
+        self._written_bytes = 0
+    
+    def emit(self, record):
+        """Format once, rotate on the running byte count if needed, then write
+        
+        This replaces shouldRollover(), which would format the record again
+        and probe the file on every call.
+        """
+        try:
+            text = self.format(record) + self.terminator
+            if text.isascii():
+                size = len(text)
+            else:
+                size = len(text.encode(self._size_encoding, self.errors or 'strict'))
+            
+            if self.maxBytes > 0 and self._written_bytes + size >= self.maxBytes:
+                self.doRollover()
+            
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(text)
+            self._written_bytes += size
+            
+            # DEBUG/INFO stay buffered; the buffer drains itself when full
+            if record.levelno >= logging.WARNING:
+                self.flush()
+            
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves traceback formatting to the listener thread"""
+    
+    def prepare(self, record):
+        """Resolve the message now but pass exc_info through the queue unformatted"""
+        msg = record.getMessage()
+        record = copy.copy(record)
+        record.message = msg
+        record.msg = msg
+        record.args = None
+        return record
+
 class Logger:
     """Centralized logging system for the application"""
     
     _instance = None
+    _logger = None  # Shared logging.Logger, set once the instance is initialized
     _lock = threading.Lock()
     
     def __new__(cls):
         """Singleton pattern to ensure only one logger instance"""
-        if cls._instance is None:
+        instance = cls._instance
+        if instance is None:
             with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
+                instance = cls._instance
+                if instance is None:
+                    # Initialize under the lock so setup runs exactly once
+                    instance = super().__new__(cls)
+                    instance._initialize()
+                    cls._instance = instance
+        return instance
     
-    def __init__(self):
-        """Initialize logger if not already initialized"""
-        if hasattr(self, '_initialized'):
-            return
-        
-        self._initialized = True
+    def _initialize(self):
+        """Initialize logger state"""
         self.logger = None
         self.log_file = None
         self.log_directory = None
+        self._log_files_cache = None  # (monotonic timestamp, directory, files)
+        self._listener = None
+        self._console_handler = None
         
         self._setup_logger()
+        Logger._logger = self.logger
     
     def _setup_logger(self):
         """Setup the logging configuration"""
@@ -55,18 +217,11 @@ class Logger:
             self.logger.handlers.clear()
             
             # Create formatters
-            detailed_formatter = logging.Formatter(
-                fmt='%(asctime)s | %(levelname)-8s | %(name)s:%(lineno)d | %(funcName)s() | %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
-            
-            simple_formatter = logging.Formatter(
-                fmt='%(asctime)s | %(levelname)-8s | %(message)s',
-                datefmt='%H:%M:%S'
-            )
+            detailed_formatter = LineFormatter(detailed=True, datefmt='%Y-%m-%d %H:%M:%S')
+            simple_formatter = LineFormatter(detailed=False, datefmt='%H:%M:%S')
             
             # File handler with rotation
-            file_handler = logging.handlers.RotatingFileHandler(
+            file_handler = FastRotatingFileHandler(
                 self.log_file,
                 maxBytes=10 * 1024 * 1024,  # 10MB
                 backupCount=5,
@@ -74,20 +229,23 @@ class Logger:
             )
             file_handler.setLevel(logging.DEBUG)
             file_handler.setFormatter(detailed_formatter)
-            self.logger.addHandler(file_handler)
             
             # Console handler
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setLevel(logging.INFO)
             console_handler.setFormatter(simple_formatter)
-            self.logger.addHandler(console_handler)
+            self._console_handler = console_handler
             
-            # Error file handler
-            error_file = self.log_directory / f"errors_{timestamp}.log"
-            error_handler = logging.FileHandler(error_file, encoding='utf-8')
-            error_handler.setLevel(logging.ERROR)
-            error_handler.setFormatter(detailed_formatter)
-            self.logger.addHandler(error_handler)
+            # Errors are written once to the main log; see extract_errors()
+            
+            # Format and write on a background thread; callers only enqueue
+            log_queue = self._queue = queue.Queue()  # join() lets flush() wait for the listener
+            self._listener = logging.handlers.QueueListener(
+                log_queue, file_handler, console_handler, respect_handler_level=True
+            )
+            self.logger.addHandler(DeferredQueueHandler(log_queue))
+            self._listener.start()
+            atexit.register(self._listener.stop)
             
             # Log startup
             self.logger.info("=" * 80)
@@ -110,8 +268,10 @@ class Logger:
     @classmethod
     def get_logger(cls):
         """Get the logger instance"""
-        instance = cls()
-        return instance.logger
+        logger = cls._logger
+        if logger is None:
+            logger = cls().logger
+        return logger
     
     def set_level(self, level):
         """Set logging level"""
@@ -122,31 +282,48 @@ class Logger:
             self.logger.setLevel(level)
             
             # Update console handler level
-            for handler in self.logger.handlers:
-                if isinstance(handler, logging.StreamHandler) and handler.stream == sys.stdout:
-                    handler.setLevel(level)
+            if self._console_handler:
+                self._console_handler.setLevel(level)
             
             self.logger.info(f"Logging level set to: {logging.getLevelName(level)}")
             
         except Exception as e:
             self.logger.error(f"Error setting log level: {e}")
     
+    def flush(self):
+        """Flush queued and buffered records to their files"""
+        try:
+            handlers = list(self.logger.handlers)
+            if self._listener:
+                # Wait until the listener has handled every record queued so far
+                if getattr(self._listener, '_thread', None) is not None:
+                    self._queue.join()
+                handlers.extend(self._listener.handlers)
+            
+            for handler in handlers:
+                handler.flush()
+                
+        except Exception as e:
+            self.logger.error(f"Error flushing log handlers: {e}")
+    
     def add_file_handler(self, file_path, level=logging.DEBUG):
         """Add additional file handler"""
         try:
             file_path = Path(file_path)
             file_path.parent.mkdir(parents=True, exist_ok=True)
             
-            handler = logging.FileHandler(file_path, encoding='utf-8')
+            # Open the file on the first record that reaches it, not up front
+            handler = logging.FileHandler(file_path, encoding='utf-8', delay=True)
             handler.setLevel(level)
             
-            formatter = logging.Formatter(
+            formatter = CachedTimeFormatter(
                 fmt='%(asctime)s | %(levelname)-8s | %(name)s:%(lineno)d | %(message)s',
                 datefmt='%Y-%m-%d %H:%M:%S'
             )
             handler.setFormatter(formatter)
             
             self.logger.addHandler(handler)
+            self._invalidate_log_files()
             self.logger.info(f"Added file handler: {file_path}")
             
         except Exception as e:
@@ -158,24 +335,37 @@ class Logger:
             if not self.log_directory or not self.log_directory.exists():
                 return []
             
+            # Reuse a recent listing of the same directory
+            now = time.monotonic()
+            cache = self._log_files_cache
+            if cache and cache[1] == self.log_directory and now - cache[0] < _LOG_FILES_TTL:
+                return list(cache[2])
+            
             log_files = []
-            for file_path in self.log_directory.iterdir():
-                if file_path.is_file() and file_path.suffix == '.log':
-                    log_files.append({
-                        'path': str(file_path),
-                        'name': file_path.name,
-                        'size': file_path.stat().st_size,
-                        'modified': file_path.stat().st_mtime
-                    })
+            with os.scandir(self.log_directory) as it:
+                for entry in it:
+                    if entry.name.endswith('.log') and entry.is_file():
+                        st = entry.stat()
+                        log_files.append({
+                            'path': entry.path,
+                            'name': entry.name,
+                            'size': st.st_size,
+                            'modified': st.st_mtime
+                        })
             
             # Sort by modification time (newest first)
             log_files.sort(key=lambda x: x['modified'], reverse=True)
-            return log_files
+            self._log_files_cache = (now, self.log_directory, log_files)
+            return list(log_files)
             
         except Exception as e:
             self.logger.error(f"Error getting log files: {e}")
             return []
     
+    def _invalidate_log_files(self):
+        """Drop the cached get_log_files() listing"""
+        self._log_files_cache = None
+    
     def clear_old_logs(self, days_to_keep=7):
         """Clear log files older than specified days"""
         try:
@@ -185,20 +375,34 @@ class Logger:
             from datetime import timedelta
             cutoff_time = datetime.now() - timedelta(days=days_to_keep)
             cutoff_timestamp = cutoff_time.timestamp()
+            cutoff_day = int(cutoff_time.strftime('%Y%m%d'))
+            current_log = str(self.log_file) if self.log_file else None
             
             deleted_count = 0
-            for file_path in self.log_directory.iterdir():
-                if (file_path.is_file() and 
-                    file_path.suffix == '.log' and 
-                    file_path.stat().st_mtime < cutoff_timestamp):
+            with os.scandir(self.log_directory) as it:
+                for entry in it:
+                    if not entry.name.endswith('.log') or not entry.is_file():
+                        continue
                     
-                    try:
-                        file_path.unlink()
-                        deleted_count += 1
-                        self.logger.info(f"Deleted old log file: {file_path.name}")
-                    except Exception as del_error:
-                        self.logger.warning(f"Could not delete log file {file_path}: {del_error}")
-            
+                    if entry.path == current_log:
+                        continue  # Still being written, whatever its date
+                    
+                    # Dated log names decide without a stat(); anything else falls back to mtime
+                    match = _DATED_LOG_RE.match(entry.name)
+                    if match:
+                        expired = int(match.group(1)) < cutoff_day
+                    else:
+                        expired = entry.stat().st_mtime < cutoff_timestamp
+                    
+                    if expired:
+                        try:
+                            os.unlink(entry.path)
+                            deleted_count += 1
+                            self.logger.info(f"Deleted old log file: {entry.name}")
+                        except Exception as del_error:
+                            self.logger.warning(f"Could not delete log file {entry.path}: {del_error}")
+            
+            self._invalidate_log_files()
             self.logger.info(f"Cleared {deleted_count} old log files")
             return deleted_count
             
@@ -212,9 +416,15 @@ class Logger:
             output_file = Path(output_file)
             output_file.parent.mkdir(parents=True, exist_ok=True)
             
+            self.flush()
             exported_lines = 0
             
-            with open(output_file, 'w', encoding='utf-8') as out_f:
+            # Resolve the level threshold once rather than per line
+            min_level_num = _LEVEL_HIERARCHY.get(level.upper(), 0) if level else None
+            start_key = _date_key(start_date)
+            end_key = _date_key(end_date)
+            
+            with open(output_file, 'w', encoding='utf-8', buffering=_EXPORT_BUFFER_SIZE) as out_f:
                 # Write header
                 out_f.write(f"Video Player Log Export\n")
                 out_f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
@@ -226,18 +436,33 @@ class Logger:
                     out_f.write(f"Min Level: {level}\n")
                 out_f.write("=" * 80 + "\n\n")
                 
-                # Process log files
                 log_files = self.get_log_files()
+                
+                # Without filters the files are copied byte-for-byte
+                if not (start_date or end_date or level):
+                    out_f.flush()
+                    exported_bytes = 0
+                    for log_info in log_files:
+                        try:
+                            exported_bytes += self._copy_log_bytes(log_info['path'], out_f.buffer)
+                        except Exception as file_error:
+                            self.logger.warning(f"Could not read log file {log_info['path']}: {file_error}")
+                    
+                    self.logger.info(f"Exported {exported_bytes} bytes of logs to {output_file}")
+                    return True
+                
+                # Filter ~1 MB batches of lines with filter()/join() so the loop runs in C
+                include = functools.partial(self._should_include_log_line, start_date=start_key,
+                                            end_date=end_key, min_level=min_level_num)
                 for log_info in log_files:
                     log_path = Path(log_info['path'])
                     
                     try:
                         with open(log_path, 'r', encoding='utf-8') as log_f:
-                            for line in log_f:
-                                # Apply filters if specified
-                                if self._should_include_log_line(line, start_date, end_date, level):
-                                    out_f.write(line)
-                                    exported_lines += 1
+                            while lines := log_f.readlines(_EXPORT_BUFFER_SIZE):
+                                kept = list(filter(include, lines))
+                                exported_lines += len(kept)
+                                out_f.write(''.join(kept))
                     
                     except Exception as file_error:
                         self.logger.warning(f"Could not read log file {log_path}: {file_error}")
@@ -249,49 +474,92 @@ class Logger:
             self.logger.error(f"Error exporting logs: {e}")
             return False
     
+    @staticmethod
+    def _copy_log_bytes(src_path, out_f):
+        """Append a file's raw bytes to a binary stream, returning the byte count"""
+        with open(src_path, 'rb') as in_f:
+            offset = 0
+            
+            # Let the kernel move the data where sendfile() is available
+            if hasattr(os, 'sendfile'):
+                out_f.flush()
+                size = os.fstat(in_f.fileno()).st_size
+                try:
+                    while offset < size:
+                        sent = os.sendfile(out_f.fileno(), in_f.fileno(), offset, size - offset)
+                        if not sent:
+                            break
+                        offset += sent
+                    return offset
+                except OSError:
+                    in_f.seek(offset)  # Finish the copy in user space
+            
+            shutil.copyfileobj(in_f, out_f, _EXPORT_BUFFER_SIZE)
+            out_f.flush()
+            return in_f.tell()
+    
+    def extract_errors(self, output_path=None):
+        """Write ERROR and CRITICAL records from the current log to a file"""
+        try:
+            if not self.log_file or not self.log_file.exists():
+                return 0
+            
+            self.flush()
+            
+            if output_path is None:
+                output_path = self.log_file.with_name(self.log_file.name.replace('video_player_', 'errors_', 1))
+            output_path = Path(output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            min_level_num = _LEVEL_HIERARCHY['ERROR']
+            extracted = 0
+            include = False
+            
+            with open(self.log_file, 'r', encoding='utf-8') as log_f, \
+                 open(output_path, 'w', encoding='utf-8', buffering=_EXPORT_BUFFER_SIZE) as out_f:
+                for line in log_f:
+                    # Continuation lines (tracebacks) follow their record
+                    if _LINE_RE.match(line):
+                        include = self._should_include_log_line(line, min_level=min_level_num)
+                        if include:
+                            extracted += 1
+                    
+                    if include:
+                        out_f.write(line)
+            
+            self._invalidate_log_files()
+            self.logger.info(f"Extracted {extracted} error records to {output_path}")
+            return extracted
+            
+        except Exception as e:
+            self.logger.error(f"Error extracting errors: {e}")
+            return 0
+    
     def _should_include_log_line(self, line, start_date=None, end_date=None, min_level=None):
         """Check if log line should be included based on filters"""
         try:
-            # Basic format check
-            if '|' not in line:
+            match = _LINE_RE.match(line)
+            if not match:
                 return True  # Include non-standard lines
             
-            parts = line.split('|')
-            if len(parts) < 3:
-                return True
-            
-            # Extract timestamp and level
-            timestamp_str = parts[0].strip()
-            level_str = parts[1].strip()
-            
-            # Date filtering
+            # Date filtering on integer fields instead of strptime
             if start_date or end_date:
-                try:
-                    log_date = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
-                    
-                    if start_date and log_date < start_date:
-                        return False
-                    
-                    if end_date and log_date > end_date:
-                        return False
-                        
-                except ValueError:
-                    pass  # Include if can't parse date
-            
-            # Level filtering
-            if min_level:
-                level_hierarchy = {
-                    'DEBUG': 0,
-                    'INFO': 1,
-                    'WARNING': 2,
-                    'ERROR': 3,
-                    'CRITICAL': 4
-                }
+                log_key = (int(line[0:4]), int(line[5:7]), int(line[8:10]),
+                           int(line[11:13]), int(line[14:16]), int(line[17:19]), 0)
                 
-                line_level = level_hierarchy.get(level_str, 0)
-                min_level_num = level_hierarchy.get(min_level.upper(), 0)
+                if start_date and log_key < _date_key(start_date):
+                    return False
                 
-                if line_level < min_level_num:
+                if end_date and log_key > _date_key(end_date):
+                    return False
+            
+            # Level filtering (accepts a level name or a precomputed rank)
+            if min_level is not None:
+                if isinstance(min_level, str):
+                    min_level = _LEVEL_HIERARCHY.get(min_level.upper(), 0)
+                
+                line_level = _LEVEL_HIERARCHY.get(match.group(2), 0)
+                if line_level < min_level:
                     return False
             
             return True
@@ -316,13 +584,18 @@ class Logger:
             
             # Count log levels in current log file
             if self.log_file and self.log_file.exists():
+                self.flush()
                 try:
-                    with open(self.log_file, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            for level in stats['levels']:
-                                if f'| {level}' in line:
-                                    stats['levels'][level] += 1
-                                    break
+                    levels = stats['levels']
+                    # Keep enough bytes between chunks to catch a pattern split at the boundary
+                    overlap = max(map(len, _LEVEL_PATTERNS.values())) - 1
+                    tail = b''
+                    with open(self.log_file, 'rb') as f:
+                        while chunk := f.read(_EXPORT_BUFFER_SIZE):
+                            chunk = tail + chunk
+                            for level, pattern in _LEVEL_PATTERNS.items():
+                                levels[level] += chunk.count(pattern)
+                            tail = chunk[-overlap:]
                 except Exception:
                     pass
             
@@ -338,9 +611,8 @@ class Logger:
             context_logger = logging.getLogger(f"VideoPlayer.{context_name}")
             context_logger.setLevel(self.logger.level)
             
-            # Add the same handlers as main logger
-            for handler in self.logger.handlers:
-                context_logger.addHandler(handler)
+            # Records propagate to the main logger, which owns the handlers
+            context_logger.propagate = True
             
             return context_logger
             
@@ -352,17 +624,23 @@ class Logger:
 def log_performance(func):
     """Decorator to log function execution time"""
     def wrapper(*args, **kwargs):
-        logger = Logger.get_logger()
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
             result = func(*args, **kwargs)
-            execution_time = (datetime.now() - start_time).total_seconds()
-            logger.debug(f"Function {func.__name__} executed in {execution_time:.4f} seconds")
+            execution_time = time.perf_counter() - start_time
+            
+            # Fetched per call rather than at decoration time, so decorating
+            # a function at import does not initialize logging; get_logger()
+            # is a single class attribute read once set up
+            logger = Logger.get_logger()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Function %s executed in %.4f seconds", func.__name__, execution_time)
             return result
             
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
+            logger = Logger.get_logger()
             logger.error(f"Function {func.__name__} failed after {execution_time:.4f} seconds: {e}")
             raise
             
@@ -372,12 +650,12 @@ def log_performance(func):
 def log_errors(func):
     """Decorator to log function errors"""
     def wrapper(*args, **kwargs):
-        logger = Logger.get_logger()
-        
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            logger.error(f"Error in {func.__name__}: {e}", exc_info=True)
+            # Only failures need the logger, so successful calls skip the lookup
+            logger = Logger.get_logger()
+            logger.error("Error in %s: %s", func.__name__, e, exc_info=e)
             raise
             
     return wrapper